@@ -12,15 +12,80 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import subprocess
 import time
-from PIL import Image, ImageTk
-import platform 
+import platform
 import os
+import functools
 import json
+import mmap
 import re
+import numpy as np
 import pandas as pd
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, gettempdir
 import threading
 import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Session files are encoded with orjson when it is available (native
+# encoder, emits bytes directly); stdlib json is the fallback.
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=4).encode()
+
+    _json_loads = json.loads
+
+# Translate table for "Clean Vector Data": maps '(' and ')' to spaces in
+# a single C-level pass instead of two full-copy str.replace calls.
+_CLEAN_TBL = bytes.maketrans(b"()", b"  ")
+
+# OpenFOAM function-object header line, e.g. "# Time   Ux   Uy   Uz".
+_HEADER_LINE_RE = re.compile(rb'^[ \t]*# Time[^\n]*', re.M)
+
+# The four OpenFOAM log line shapes of interest (time steps, solver
+# residuals, vector/scalar functionObjects) fused into one alternation;
+# compiled once at import instead of per LogfileParser instance. See
+# LogfileParser.parse_lines for the priority/dispatch rules.
+_TIME_RE = re.compile(r"^\s*Time = (\S+)\s*$")
+
+_LOG_LINE_RE = re.compile(
+    r"^[ \t]*Time = (?P<time>\S+)[ \t\r]*$"
+    r"|Solving for (?P<solver_var>\S+), Initial residual = (?P<solver_ires>\S+), Final residual = (?P<solver_fres>\S+), No Iterations[ \t]+(?P<solver_iters>\d+)"
+    r"|^[ \t]*(?P<vec_name>.+?)[ \t]*=[ \t]*\((?P<vec_vals>.+)\)[ \t\r]*$"
+    r"|^[ \t]*(?P<sc_name>.+?)[ \t]*=[ \t]*(?P<sc_val>\S+)[ \t\r]*$",
+    re.MULTILINE | re.ASCII  # OpenFOAM logs are ASCII; skip Unicode \S/\d tables
+)
+
+# Column-name cleanup for LogfileParser._clean_column_name: separators
+# and brackets map to '_' via one C-level translate pass, then two small
+# regex passes tidy the result.
+_CLEAN_NAME_TBL = str.maketrans({c: '_' for c in ' \t\n\r\f\v(),'})
+_CLEAN_OF_RE = re.compile(r'_of_')
+_CLEAN_MULTI_RE = re.compile(r'__+')
+
+# Constant lookup tables, hoisted so the per-plot hot path does not
+# rebuild them on every call.
+_GRID_COLORS = {'Light': 'gray40', 'Medium': 'gray20', 'Dark': 'gray0'}
+_LOGFILE_GRID_COLORS = {'Light': 'gray80', 'Medium': 'gray50', 'Dark': 'gray20'}
+_GRID_STYLES = ('Light', 'Medium', 'Dark')
+_PLOT_STYLES = ('lines', 'points', 'linespoints', 'dots', 'impulses')
+_TERM_MAP = {'.png': 'pngcairo', '.svg': 'svg', '.pdf': 'pdfcairo', '.eps': 'postscript eps enhanced color'}
+
+# Keystroke validators: accept any prefix of a valid number so values
+# like "-" or "1e" can be typed through.
+_FLOAT_PREFIX_RE = re.compile(r'^[+-]?\d*\.?\d*([eE][+-]?\d*)?$')
+
+def _is_float_prefix(value):
+    return bool(_FLOAT_PREFIX_RE.match(value))
+
+def _is_int_prefix(value):
+    return value == '' or value.isdigit()
 
 # --- Column Selector Dialog ---
 class ColumnSelectorDialog(tk.Toplevel):
@@ -42,8 +107,8 @@ class ColumnSelectorDialog(tk.Toplevel):
         list_frame.pack(fill='both', expand=True)
         
         self.listbox = tk.Listbox(list_frame, selectmode='multiple', height=15, exportselection=False)
-        for col in self.all_columns:
-            self.listbox.insert('end', col)
+        # One variadic insert: a single Tcl call regardless of column count
+        self.listbox.insert('end', *self.all_columns)
         
         list_scroll_y = ttk.Scrollbar(list_frame, orient='vertical', command=self.listbox.yview)
         list_scroll_x = ttk.Scrollbar(list_frame, orient='horizontal', command=self.listbox.xview)
@@ -81,118 +146,136 @@ class ColumnSelectorDialog(tk.Toplevel):
 class LogfileParser:
     def __init__(self, filepath=None):
         self.filepath = filepath
-        # Regex to find the main time steps
-        self.time_re = re.compile(r"^\s*Time = (\S+)\s*$")
-        # Regex for solver residuals
-        self.solver_re = re.compile(
-            r"Solving for (\S+), Initial residual = (\S+), Final residual = (\S+), No Iterations\s+(\d+)"
-        )
-        # Regex for functionObjects with a vector value. Captures name and value string.
-        self.fo_vector_re = re.compile(r"^\s*(.+?)\s*=\s*\((.+)\)\s*$")
-        # Regex for functionObjects with a single scalar value. Captures name and value string.
-        self.fo_scalar_re = re.compile(r"^\s*(.+?)\s*=\s*(\S+)\s*$")
 
-    def _clean_column_name(self, raw_name):
-        """Creates a clean, valid column name from a raw string found in the log file."""
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _clean_column_name(raw_name):
+        """Creates a clean, valid column name from a raw string found in the log file.
+
+        The same raw names recur thousands of times in a long run, so
+        results are memoized.
+        """
         # Replace common separators and brackets with underscores
-        name = re.sub(r'[\s\(\),]', '_', raw_name)
+        name = raw_name.translate(_CLEAN_NAME_TBL)
         # Remove 'of' if it's a whole word, surrounded by underscores
-        name = re.sub(r'_of_', '_', name)
+        name = _CLEAN_OF_RE.sub('_', name)
         # Collapse multiple underscores into one
-        name = re.sub(r'__+', '_', name)
+        name = _CLEAN_MULTI_RE.sub('_', name)
         # Remove leading/trailing underscores
         name = name.strip('_')
         return name
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _solver_col(var):
+        """Memoized residual column name; a run has ~a dozen solver vars."""
+        return f'{var}_initial_residual'
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _vector_cols(name):
+        """Memoized (name_x, name_y, name_z) tuple for a vector quantity."""
+        return (f'{name}_x', f'{name}_y', f'{name}_z')
+
     def parse_lines(self, lines, monitored_columns=None):
-        """Parses a list of string lines and returns a list of record dictionaries."""
-        records = []
+        """Parses a list of string lines into a dict of per-column value lists.
+
+        Columns are accumulated as parallel lists (padded with None where
+        a time step lacks a value) so the caller can build the DataFrame
+        in one shot with pd.DataFrame(columns) instead of paying for
+        from_records' per-cell dict hashing and type inference.
+        """
+        text = "".join(lines)
+        columns = {}
+        row_count = 0
         current_record = {}
-        
+
+        def flush_record(record):
+            nonlocal row_count
+            for name, value in record.items():
+                col = columns.get(name)
+                if col is None:
+                    col = columns[name] = [None] * row_count
+                col.append(value)
+            row_count += 1
+            for col in columns.values():
+                if len(col) < row_count:
+                    col.append(None)
+
         # Using a set for faster lookups if a filter is provided
         monitored_set = set(monitored_columns) if monitored_columns else None
-        
-        for line in lines:
+
+        for match in _LOG_LINE_RE.finditer(text):
+            # lastgroup names the final group the winning alternative
+            # filled in, which identifies the line shape.
+            kind = match.lastgroup
+
             # Check for a new time step
-            time_match = self.time_re.match(line)
-            if time_match:
+            if kind == 'time':
                 if current_record: # Save the previous record if it exists
-                    records.append(current_record)
-                current_record = {'Time': float(time_match.group(1))}
+                    flush_record(current_record)
+                current_record = {'Time': float(match['time'])}
                 continue
 
             if not current_record: # Skip lines before the first "Time ="
                 continue
 
-            # Skip continuity error lines to avoid creating unnecessary columns
-            if "time step continuity errors" in line:
-                continue
-                
             # Check for solver lines
-            solver_match = self.solver_re.search(line)
-            if solver_match:
-                var, i_res, f_res, iters = solver_match.groups()
-                col_name = f'{var}_initial_residual'
+            if kind == 'solver_iters':
+                col_name = self._solver_col(match['solver_var'])
                 if monitored_set is None or col_name in monitored_set:
-                    current_record[col_name] = float(i_res)
-                continue # Move to next line after match
-            
-            # Check for function object lines (vector or scalar)
-            line_stripped = line.strip()
-
-            # Try vector match first, as its pattern is more specific
-            vector_match = self.fo_vector_re.match(line_stripped)
-            if vector_match:
-                name_raw, values_str = vector_match.groups()
-                # Exclude solver lines which can sometimes match this regex
-                if "Solving for" not in name_raw:
+                    current_record[col_name] = float(match['solver_ires'])
+
+            # Check for function object lines with a vector value
+            elif kind == 'vec_vals':
+                name_raw = match['vec_name']
+                # Exclude solver/continuity lines which can also match
+                if "Solving for" not in name_raw and "time step continuity errors" not in name_raw:
                     name = self._clean_column_name(name_raw)
+                    # Memoized: the same vector quantities recur on every
+                    # time step, so no per-line string building.
+                    name_x, name_y, name_z = self._vector_cols(name)
                     try:
-                        values = [float(v) for v in values_str.split()]
-                        if monitored_set is None or f'{name}_x' in monitored_set:
-                            current_record[f'{name}_x'] = values[0]
-                        if len(values) > 1 and (monitored_set is None or f'{name}_y' in monitored_set):
-                            current_record[f'{name}_y'] = values[1]
-                        if len(values) > 2 and (monitored_set is None or f'{name}_z' in monitored_set):
-                            current_record[f'{name}_z'] = values[2]
+                        values = [float(v) for v in match['vec_vals'].split()]
+                        if monitored_set is None or name_x in monitored_set:
+                            current_record[name_x] = values[0]
+                        if len(values) > 1 and (monitored_set is None or name_y in monitored_set):
+                            current_record[name_y] = values[1]
+                        if len(values) > 2 and (monitored_set is None or name_z in monitored_set):
+                            current_record[name_z] = values[2]
                     except (ValueError, IndexError):
                         pass # Ignore if values are not numbers
-                continue
-            
-            # Then try scalar match
-            scalar_match = self.fo_scalar_re.match(line_stripped)
-            if scalar_match:
-                name_raw, val_str = scalar_match.groups()
-                # Exclude solver lines
-                if "Solving for" not in name_raw:
+
+            # Then function object lines with a single scalar value
+            elif kind == 'sc_val':
+                name_raw = match['sc_name']
+                if "Solving for" not in name_raw and "time step continuity errors" not in name_raw:
                     name = self._clean_column_name(name_raw)
                     if monitored_set is None or name in monitored_set:
                         try:
-                            val = float(val_str)
-                            current_record[name] = val
+                            current_record[name] = float(match['sc_val'])
                         except (ValueError, TypeError):
                             pass
-                continue
 
-        if current_record: # Append the last record
-            records.append(current_record)
-            
-        return records
+        if current_record: # Flush the last record
+            flush_record(current_record)
+
+        return columns
 
     def parse(self):
         try:
+            # One read of the whole buffer: the fused regex scans a single
+            # string, so there is no point splitting into per-line objects.
             with open(self.filepath, 'r') as f:
-                lines = f.readlines()
+                text = f.read()
                 byte_offset = f.tell()
-            
-            records = self.parse_lines(lines)
 
-            if not records:
+            columns = self.parse_lines((text,))
+
+            if not columns:
                 return None, "No data could be parsed. Check the logfile format.", 0
 
-            df = pd.DataFrame.from_records(records)
-            df = df.ffill()
-            df = df.sort_values(by='Time').drop_duplicates(subset='Time', keep='last')
+            df = self._finalize_frame(pd.DataFrame(columns))
             
             if 'Time' not in df.columns or df.empty:
                  return None, "Parsing resulted in an empty dataset or 'Time' column is missing.", 0
@@ -202,6 +285,24 @@ class LogfileParser:
         except Exception as e:
             return None, f"An error occurred during parsing: {e}", 0
 
+    @staticmethod
+    def _finalize_frame(df):
+        """Forward-fill and keep the last row of each Time value.
+
+        OpenFOAM logs are monotonically increasing in time, so the frame
+        is only sorted when that does not hold (e.g. a restarted run
+        appended to the same file); duplicate times are dropped with one
+        shift-compare mask instead of a drop_duplicates pass.
+        """
+        df = df.ffill()
+        if not df['Time'].is_monotonic_increasing:
+            df = df.sort_values(by='Time', kind='stable')
+        return df.loc[df['Time'].ne(df['Time'].shift(-1))].reset_index(drop=True)
+
+# parse_lines/_finalize_frame are stateless, so one shared instance serves
+# every incremental tail tick across all tabs.
+_LOG_PARSER = LogfileParser()
+
 # --- Main Application Class ---
 class GnuplotApp:
     def __init__(self, root):
@@ -209,15 +310,39 @@ class GnuplotApp:
         self.root.title("Embedded Gnuplot GUI V28.0") # Version bump!
         self.root.geometry("1200x800")
         
-        self.auto_replotting = False
-        self.active_auto_replot_job = None
-        
         self.tabs = {}
         self.tab_counter = 0
         self.right_clicked_tab_id = None
+        self._rename_popup = None
         
         self.log_queue = queue.Queue()
 
+        # One class-level <Return> binding dispatched through this map
+        # instead of a Tcl binding (and closure) per entry widget.
+        self._return_actions = {}
+        self.root.bind_class('TEntry', '<Return>', self._on_return_key)
+        self.root.bind_class('TSpinbox', '<Return>', self._on_return_key)
+
+        # Registered once; rejects invalid numeric input per keystroke so
+        # most bad values never reach the plot-time validation.
+        self._vcmd_float = (self.root.register(_is_float_prefix), '%P')
+        self._vcmd_int = (self.root.register(_is_int_prefix), '%P')
+
+        # Cleaned file contents keyed by filepath. Each entry tracks the
+        # byte offset already consumed so append-only files (the OpenFOAM
+        # case) only have their new tail read and cleaned on each replot.
+        self._clean_cache = {}
+        # Parsed '# Time ...' header fields keyed by filepath, valid while
+        # the file's mtime is unchanged.
+        self._header_cache = {}
+        # The clipboard backend is fixed for the process lifetime, so bind
+        # it once instead of branching on platform.system() per copy.
+        self._clipboard_send = {
+            'Linux': self._clipboard_send_linux,
+            'Windows': self._clipboard_send_windows,
+            'Darwin': self._clipboard_send_darwin,
+        }.get(platform.system(), self._clipboard_send_unsupported)
+
         self.menu_bar = tk.Menu(self.root)
         self.file_menu = tk.Menu(self.menu_bar, tearoff=0)
         self.file_menu.add_command(label="Load Session...", command=self.load_session)
@@ -260,7 +385,9 @@ class GnuplotApp:
 
         for key in list(self.tabs.keys()):
             self._stop_log_tail(key)
-        
+            self._enqueue_plot_job(key, None)
+            self._shutdown_gnuplot(key)
+
         # Clean up temporary files
         for tab_data in self.tabs.values():
             if tab_data.get('temp_file_path') and os.path.exists(tab_data['temp_file_path']):
@@ -270,6 +397,11 @@ class GnuplotApp:
                     print(f"Error removing temporary file: {e}")
         self.root.destroy()
 
+    def _on_return_key(self, event):
+        action = self._return_actions.get(event.widget)
+        if action:
+            action(event)
+
     def show_tab_menu(self, event):
         try:
             tab_index = event.widget.index(f"@{event.x},{event.y}")
@@ -278,29 +410,48 @@ class GnuplotApp:
             self.tab_menu.post(event.x_root, event.y_root)
         except tk.TclError: pass
 
-    def rename_tab_popup(self):
-        if not self.right_clicked_tab_id: return
+    def _build_rename_popup(self):
+        """Create the rename dialog once; later uses just show/hide it."""
         popup = tk.Toplevel(self.root)
         popup.title("Rename Tab")
-        popup.transient(self.root); popup.grab_set()
-        x, y = self.root.winfo_x() + 300, self.root.winfo_y() + 200
-        popup.geometry(f"250x100+{x}+{y}")
+        popup.withdraw()
+        popup.transient(self.root)
         ttk.Label(popup, text="Enter new tab name:").pack(pady=10)
-        new_name_var = tk.StringVar()
-        entry = ttk.Entry(popup, textvariable=new_name_var)
-        entry.pack(padx=10, fill='x'); entry.focus()
-        entry.bind("<Return>", lambda e: on_ok())
-        entry.bind("<Escape>", lambda e: popup.destroy())
-        popup.bind("<Escape>", lambda e: popup.destroy())
-
-        def on_ok():
-            new_name = new_name_var.get().strip()
-            if new_name: self.notebook.tab(self.right_clicked_tab_id, text=new_name)
-            popup.destroy()
+        self._rename_name_var = tk.StringVar()
+        entry = ttk.Entry(popup, textvariable=self._rename_name_var)
+        entry.pack(padx=10, fill='x')
+        entry.bind("<Return>", lambda e: self._rename_popup_ok())
+        entry.bind("<Escape>", lambda e: self._hide_rename_popup())
+        popup.bind("<Escape>", lambda e: self._hide_rename_popup())
+        popup.protocol("WM_DELETE_WINDOW", self._hide_rename_popup)
 
         button_frame = ttk.Frame(popup); button_frame.pack(pady=10)
-        ttk.Button(button_frame, text="OK", command=on_ok).pack(side='left', padx=5)
-        ttk.Button(button_frame, text="Cancel", command=popup.destroy).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="OK", command=self._rename_popup_ok).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self._hide_rename_popup).pack(side='left', padx=5)
+
+        self._rename_popup = popup
+        self._rename_entry = entry
+
+    def rename_tab_popup(self):
+        if not self.right_clicked_tab_id: return
+        if self._rename_popup is None:
+            self._build_rename_popup()
+        popup = self._rename_popup
+        x, y = self.root.winfo_x() + 300, self.root.winfo_y() + 200
+        popup.geometry(f"250x100+{x}+{y}")
+        self._rename_name_var.set("")
+        popup.deiconify()
+        popup.grab_set()
+        self._rename_entry.focus()
+
+    def _rename_popup_ok(self):
+        new_name = self._rename_name_var.get().strip()
+        if new_name: self.notebook.tab(self.right_clicked_tab_id, text=new_name)
+        self._hide_rename_popup()
+
+    def _hide_rename_popup(self):
+        self._rename_popup.grab_release()
+        self._rename_popup.withdraw()
 
     def add_new_tab(self):
         self.tab_counter += 1
@@ -317,7 +468,14 @@ class GnuplotApp:
             messagebox.showwarning("Action Blocked", "Cannot close the last plot tab.")
             return
         
+        # Cancel a running auto-replot before its tab disappears, so the
+        # scheduled callback cannot resurrect plotting on a freed tab.
+        if self.tabs[key].get('auto_replotting'):
+            self.stop_replot(self.tabs[key]['widgets'], key)
+
         self._stop_log_tail(key)
+        self._enqueue_plot_job(key, None)
+        self._shutdown_gnuplot(key)
 
         tab_data = self.tabs.get(key)
         if tab_data and tab_data.get('temp_file_path') and os.path.exists(tab_data['temp_file_path']):
@@ -327,6 +485,12 @@ class GnuplotApp:
                 print(f"Error removing temp file on tab close: {e}")
 
         frame_to_close = self.tabs[key]['frame']
+        # Children always continue with a '.' after the frame path; a bare
+        # prefix match would also hit sibling frames whose names merely
+        # extend this one (.!frame is a prefix of .!frame2).
+        child_prefix = self.tabs[key]['frame_path'] + '.'
+        for widget in [w for w in self._return_actions if str(w).startswith(child_prefix)]:
+            del self._return_actions[widget]
         self.notebook.forget(frame_to_close)
         del self.tabs[key]
 
@@ -343,14 +507,17 @@ class GnuplotApp:
         log_viewer_id = str(tab_data['log_viewer_frame'])
 
         if mode == "Normal":
-            if log_viewer_id in plot_display_panedwindow.panes():
+            if tab_data['log_viewer_attached']:
                 plot_display_panedwindow.forget(log_viewer_id)
+                tab_data['log_viewer_attached'] = False
             self._stop_log_tail(key)
             widgets['logfile_mode_frame'].pack_forget()
             widgets['normal_mode_frame'].pack(fill='x', expand=True)
         else: # Plot Logfile
-            if log_viewer_id not in plot_display_panedwindow.panes():
+            self._ensure_logfile_widgets(widgets, key)
+            if not tab_data['log_viewer_attached']:
                  plot_display_panedwindow.add(tab_data['log_viewer_frame'], weight=1)
+                 tab_data['log_viewer_attached'] = True
             
             self.root.update_idletasks()
             sash_pos = int(plot_display_panedwindow.winfo_height() * 0.8) if plot_display_panedwindow.winfo_height() > 1 else 300
@@ -359,6 +526,171 @@ class GnuplotApp:
             widgets['normal_mode_frame'].pack_forget()
             widgets['logfile_mode_frame'].pack(fill='x', expand=True)
 
+    def _ensure_logfile_widgets(self, widgets, key):
+        if 'subplot_vars' not in widgets:
+            self._build_logfile_widgets(widgets, key)
+
+    def _build_logfile_widgets(self, widgets, key):
+        """Create the logfile-mode controls. Deferred until the tab first
+        needs them, since most tabs never leave Normal mode."""
+        plot_callback = widgets['plot_callback']
+        logfile_frame = widgets['logfile_mode_frame']
+
+        logfile_selection_frame = ttk.LabelFrame(logfile_frame, text="Logfile Selection", padding=10)
+        logfile_selection_frame.pack(fill='x', pady=5)
+        widgets['logfile_path'] = tk.StringVar()
+        ttk.Label(logfile_selection_frame, text="Logfile:").grid(row=0, column=0, sticky='w')
+        ttk.Entry(logfile_selection_frame, textvariable=widgets['logfile_path']).grid(row=0, column=1, sticky='ew')
+        ttk.Button(logfile_selection_frame, text="Browse...", command=lambda w=widgets: self._browse_logfile(w)).grid(row=0, column=2, padx=5)
+        ttk.Button(logfile_selection_frame, text="Parse Logfile", command=lambda w=widgets, k=key: self._parse_logfile(w, k)).grid(row=1, column=1, pady=5)
+        logfile_selection_frame.columnconfigure(1, weight=1)
+
+        # Logfile Layout & Grid
+        logfile_layout_frame = ttk.LabelFrame(logfile_frame, text="Layout, Margins & Grid", padding=10)
+        logfile_layout_frame.pack(fill='x', pady=5)
+        
+        # --- Margins ---
+        ttk.Label(logfile_layout_frame, text="Margins:").grid(row=0, column=0, sticky='w', rowspan=2)
+        
+        ttk.Label(logfile_layout_frame, text="Left").grid(row=0, column=1, sticky='s', padx=2)
+        ttk.Label(logfile_layout_frame, text="Right").grid(row=0, column=2, sticky='s', padx=2)
+        ttk.Label(logfile_layout_frame, text="Bottom").grid(row=0, column=3, sticky='s', padx=2)
+        ttk.Label(logfile_layout_frame, text="Top").grid(row=0, column=4, sticky='s', padx=2)
+
+        widgets['logfile_lmargin'] = tk.StringVar(value='0.1'); widgets['logfile_rmargin'] = tk.StringVar(value='0.9'); widgets['logfile_bmargin'] = tk.StringVar(value='0.1'); widgets['logfile_tmargin'] = tk.StringVar(value='0.9')
+        
+        lmargin_spin = ttk.Spinbox(logfile_layout_frame, from_=0.0, to=1.0, increment=0.05, textvariable=widgets['logfile_lmargin'], width=5, command=plot_callback)
+        lmargin_spin.grid(row=1, column=1, padx=2)
+        self._return_actions[lmargin_spin] = plot_callback
+        
+        rmargin_spin = ttk.Spinbox(logfile_layout_frame, from_=0.0, to=1.0, increment=0.05, textvariable=widgets['logfile_rmargin'], width=5, command=plot_callback)
+        rmargin_spin.grid(row=1, column=2, padx=2)
+        self._return_actions[rmargin_spin] = plot_callback
+
+        bmargin_spin = ttk.Spinbox(logfile_layout_frame, from_=0.0, to=1.0, increment=0.05, textvariable=widgets['logfile_bmargin'], width=5, command=plot_callback)
+        bmargin_spin.grid(row=1, column=3, padx=2)
+        self._return_actions[bmargin_spin] = plot_callback
+        
+        tmargin_spin = ttk.Spinbox(logfile_layout_frame, from_=0.0, to=1.0, increment=0.05, textvariable=widgets['logfile_tmargin'], width=5, command=plot_callback)
+        tmargin_spin.grid(row=1, column=4, padx=2)
+        self._return_actions[tmargin_spin] = plot_callback
+
+        # --- Spacing ---
+        ttk.Label(logfile_layout_frame, text="Spacing (X, Y):").grid(row=2, column=0, sticky='w', pady=(5,2))
+        widgets['logfile_xspacing'] = tk.StringVar(value='0.08'); widgets['logfile_yspacing'] = tk.StringVar(value='0.08')
+
+        xspacing_spin = ttk.Spinbox(logfile_layout_frame, from_=0.0, to=1.0, increment=0.01, textvariable=widgets['logfile_xspacing'], width=5, command=plot_callback)
+        xspacing_spin.grid(row=2, column=1, padx=2)
+        self._return_actions[xspacing_spin] = plot_callback
+
+        yspacing_spin = ttk.Spinbox(logfile_layout_frame, from_=0.0, to=1.0, increment=0.01, textvariable=widgets['logfile_yspacing'], width=5, command=plot_callback)
+        yspacing_spin.grid(row=2, column=2, padx=2)
+        self._return_actions[yspacing_spin] = plot_callback
+
+        # --- Grid ---
+        ttk.Label(logfile_layout_frame, text="Grid:").grid(row=3, column=0, sticky='w', pady=2)
+        widgets['logfile_grid_on'] = tk.BooleanVar(value=True); widgets['logfile_grid_style'] = tk.StringVar(value='Medium')
+        ttk.Checkbutton(logfile_layout_frame, text="On", variable=widgets['logfile_grid_on'], command=plot_callback).grid(row=3, column=1, sticky='w')
+        grid_combo = ttk.Combobox(logfile_layout_frame, textvariable=widgets['logfile_grid_style'], values=_GRID_STYLES, width=8)
+        grid_combo.grid(row=3, column=2, columnspan=2, sticky='w')
+        grid_combo.bind("<<ComboboxSelected>>", plot_callback)
+
+        # --- Logfile Mode Actions (Moved Up) ---
+        logfile_action_frame = ttk.LabelFrame(logfile_frame, text="Plot Actions", padding=10)
+        logfile_action_frame.pack(fill='x', pady=5)
+        
+        logfile_main_action_frame = ttk.Frame(logfile_action_frame); logfile_main_action_frame.pack(pady=2)
+        ttk.Button(logfile_main_action_frame, text="Plot / Refresh", command=lambda w=widgets, k=key: self.refresh_and_plot(w, k)).pack()
+        
+        logfile_replot_frame = ttk.Frame(logfile_action_frame); logfile_replot_frame.pack(pady=2)
+        widgets['logfile_replot_interval'] = tk.StringVar(value='1000')
+        ttk.Label(logfile_replot_frame, text="Auto (ms):").pack(side='left')
+        ttk.Entry(logfile_replot_frame, textvariable=widgets['logfile_replot_interval'], width=8).pack(side='left', padx=5)
+        widgets['logfile_start_button'] = ttk.Button(logfile_replot_frame, text="Start", command=lambda w=widgets, k=key: self.start_replot(w, k)); widgets['logfile_start_button'].pack(side='left')
+        widgets['logfile_stop_button'] = ttk.Button(logfile_replot_frame, text="Stop", state="disabled", command=lambda w=widgets, k=key: self.stop_replot(w, k)); widgets['logfile_stop_button'].pack(side='left', padx=5)
+
+        subplot_config_frame = ttk.LabelFrame(logfile_frame, text="Sub-plot Configuration", padding=10)
+        subplot_config_frame.pack(fill='x', pady=5, expand=True)
+        
+        widgets['subplot_vars'] = []
+        
+        for i in range(4):
+            title = ["Top-Left", "Top-Right", "Bottom-Left", "Bottom-Right"][i]
+            
+            sub_frame = ttk.LabelFrame(subplot_config_frame, text=f"Sub-plot {i+1} ({title})", padding=10)
+            sub_frame.grid(row=i, column=0, sticky='ew', padx=5, pady=5)
+            subplot_config_frame.columnconfigure(0, weight=1)
+
+            # --- Row 0: Labels and Options ---
+            top_frame = ttk.Frame(sub_frame); top_frame.pack(fill='x')
+            
+            y_label_var = tk.StringVar()
+            ttk.Label(top_frame, text="Y-Axis Label:").pack(side='left')
+            y_label_entry = ttk.Entry(top_frame, textvariable=y_label_var, width=20)
+            y_label_entry.pack(side='left', fill='x', expand=True, padx=5)
+            self._return_actions[y_label_entry] = plot_callback
+            
+            y_log_var = tk.BooleanVar(value=False)
+            ttk.Checkbutton(top_frame, text="Y Log", variable=y_log_var, command=plot_callback).pack(side='left', padx=5)
+
+            show_legend_var = tk.BooleanVar(value=True)
+            ttk.Checkbutton(top_frame, text="Show Legend", variable=show_legend_var, command=plot_callback).pack(side='left', padx=5)
+            
+            # --- Row 1 & 2: Axis Ranges ---
+            range_frame = ttk.Frame(sub_frame); range_frame.pack(fill='x', pady=5)
+            
+            def create_range_controls(parent, axis_name, row, plot_cb):
+                ttk.Label(parent, text=f"{axis_name}-Axis Range:").grid(row=row, column=0, sticky="w")
+                range_mode_var = tk.StringVar(value='auto')
+                min_var = tk.StringVar(); max_var = tk.StringVar()
+                
+                min_entry = ttk.Entry(parent, textvariable=min_var, width=8, state='disabled')
+                max_entry = ttk.Entry(parent, textvariable=max_var, width=8, state='disabled')
+
+                def update_state():
+                    state = 'normal' if range_mode_var.get() == 'manual' else 'disabled'
+                    min_entry.config(state=state)
+                    max_entry.config(state=state)
+                
+                def update_and_plot():
+                    update_state()
+                    plot_cb()
+
+                ttk.Radiobutton(parent, text="Auto", variable=range_mode_var, value='auto', command=update_and_plot).grid(row=row, column=1, sticky="w")
+                ttk.Radiobutton(parent, text="Manual:", variable=range_mode_var, value='manual', command=update_and_plot).grid(row=row, column=2, sticky="w")
+                min_entry.grid(row=row, column=3, padx=2)
+                ttk.Label(parent, text="to").grid(row=row, column=4, padx=2)
+                max_entry.grid(row=row, column=5, padx=2)
+                
+                self._return_actions[min_entry] = plot_cb
+                self._return_actions[max_entry] = plot_cb
+
+                return {
+                    'mode': range_mode_var, 'min': min_var, 'max': max_var,
+                    'min_entry': min_entry, 'max_entry': max_entry
+                }
+
+            x_range_vars = create_range_controls(range_frame, 'X', 0, plot_callback)
+            y_range_vars = create_range_controls(range_frame, 'Y', 1, plot_callback)
+
+            # --- Row 3: Column Selection Listbox ---
+            ttk.Label(sub_frame, text="Y-Axis Columns:").pack(anchor='w', pady=(5,0))
+            list_frame = ttk.Frame(sub_frame); list_frame.pack(fill='both', expand=True)
+            listbox = tk.Listbox(list_frame, selectmode='multiple', height=5, exportselection=False)
+            listbox.pack(side='left', fill='both', expand=True)
+            list_scroll = ttk.Scrollbar(list_frame, orient='vertical', command=listbox.yview); list_scroll.pack(side='right', fill='y')
+            listbox.config(yscrollcommand=list_scroll.set)
+            listbox.bind("<<ListboxSelect>>", plot_callback)
+
+            widgets['subplot_vars'].append({
+                'y_label': y_label_var, 
+                'y_log': y_log_var,
+                'show_legend': show_legend_var,
+                'x_range': x_range_vars,
+                'y_range': y_range_vars,
+                'listbox': listbox
+            })
+
     def create_plot_tab(self, title, key):
         tab_frame = ttk.Frame(self.notebook)
         paned_window = ttk.PanedWindow(tab_frame, orient='horizontal')
@@ -408,8 +740,11 @@ class GnuplotApp:
         widgets = {}
         
         # Define plot_callback early
-        plot_callback = lambda event=None, w=widgets, k=key: self.plot(w, k)
-        
+        # Widget-event replots are debounced: holding a spinbox arrow or
+        # typing Return repeatedly only renders once the burst settles.
+        plot_callback = functools.partial(self._debounced_plot, widgets, key)
+        widgets['plot_callback'] = plot_callback
+
         # --- Mode Selection ---
         mode_frame = ttk.LabelFrame(controls_frame, text="Mode", padding=10)
         mode_frame.pack(fill='x', pady=5)
@@ -444,7 +779,7 @@ class GnuplotApp:
         plot_global_title_entry = ttk.Entry(global_settings_frame, textvariable=widgets['plot_global_title'])
         plot_global_title_entry.grid(row=1, column=1, sticky='ew')
         global_settings_frame.columnconfigure(1, weight=1)
-        plot_global_title_entry.bind("<Return>", plot_callback)
+        self._return_actions[plot_global_title_entry] = plot_callback
         
         font_frame = ttk.LabelFrame(normal_frame, text="Font Sizes", padding=10)
         font_frame.pack(fill='x', pady=5)
@@ -471,11 +806,11 @@ class GnuplotApp:
         widgets['tree'].bind("<Button-1>", lambda event, w=widgets, k=key: self.toggle_checkbox(event, w, k))
 
         editor_frame = ttk.LabelFrame(normal_frame, text="Dataset Editor", padding=10); editor_frame.pack(fill='x', pady=5)
-        widgets['filepath'] = tk.StringVar(); filepath_entry = ttk.Entry(editor_frame, textvariable=widgets['filepath'], width=25); filepath_entry.grid(row=0, column=1, sticky="ew", columnspan=3); filepath_entry.bind("<Return>", plot_callback); ttk.Label(editor_frame, text="Data File:").grid(row=0, column=0, sticky="w", pady=2); ttk.Button(editor_frame, text="Browse...", command=lambda w=widgets: self.browse_file(w)).grid(row=0, column=4, padx=5)
+        widgets['filepath'] = tk.StringVar(); filepath_entry = ttk.Entry(editor_frame, textvariable=widgets['filepath'], width=25); filepath_entry.grid(row=0, column=1, sticky="ew", columnspan=3); self._return_actions[filepath_entry] = plot_callback; ttk.Label(editor_frame, text="Data File:").grid(row=0, column=0, sticky="w", pady=2); ttk.Button(editor_frame, text="Browse...", command=lambda w=widgets: self.browse_file(w)).grid(row=0, column=4, padx=5)
         
-        widgets['x_col'] = tk.StringVar(value='1'); x_col_entry = ttk.Entry(editor_frame, textvariable=widgets['x_col'], width=5); x_col_entry.grid(row=1, column=1, sticky="w"); x_col_entry.bind("<Return>", update_callback); ttk.Label(editor_frame, text="X Col:").grid(row=1, column=0, sticky="w", pady=2)
+        widgets['x_col'] = tk.StringVar(value='1'); x_col_entry = ttk.Entry(editor_frame, textvariable=widgets['x_col'], width=5); x_col_entry.grid(row=1, column=1, sticky="w"); self._return_actions[x_col_entry] = update_callback; ttk.Label(editor_frame, text="X Col:").grid(row=1, column=0, sticky="w", pady=2)
         
-        widgets['y_col'] = tk.StringVar(value='2'); y_col_entry = ttk.Entry(editor_frame, textvariable=widgets['y_col'], width=5); y_col_entry.grid(row=1, column=3, sticky="w"); y_col_entry.bind("<Return>", update_callback); ttk.Label(editor_frame, text="Y Col:").grid(row=1, column=2, sticky="e", pady=2, padx=5)
+        widgets['y_col'] = tk.StringVar(value='2'); y_col_entry = ttk.Entry(editor_frame, textvariable=widgets['y_col'], width=5); y_col_entry.grid(row=1, column=3, sticky="w"); self._return_actions[y_col_entry] = update_callback; ttk.Label(editor_frame, text="Y Col:").grid(row=1, column=2, sticky="e", pady=2, padx=5)
         
         widgets['y_axis_select'] = tk.StringVar(value='Y1'); ttk.Label(editor_frame, text="Axis:").grid(row=1, column=4, sticky="e", padx=(10,2)); 
         axis_combo = ttk.Combobox(editor_frame, textvariable=widgets['y_axis_select'], values=['Y1', 'Y2'], width=4)
@@ -483,11 +818,11 @@ class GnuplotApp:
         axis_combo.bind("<<ComboboxSelected>>", update_callback)
 
         widgets['plot_style'] = tk.StringVar(value='lines'); ttk.Label(editor_frame, text="Plot Style:").grid(row=2, column=0, sticky="w", pady=2); 
-        style_combo = ttk.Combobox(editor_frame, textvariable=widgets['plot_style'], values=['lines', 'points', 'linespoints', 'dots', 'impulses'], width=15)
+        style_combo = ttk.Combobox(editor_frame, textvariable=widgets['plot_style'], values=_PLOT_STYLES, width=15)
         style_combo.grid(row=2, column=1, sticky="ew", columnspan=2)
         style_combo.bind("<<ComboboxSelected>>", update_callback)
 
-        widgets['plot_title'] = tk.StringVar(); plot_title_entry = ttk.Entry(editor_frame, textvariable=widgets['plot_title'], width=20); plot_title_entry.grid(row=3, column=1, sticky="ew", columnspan=3); plot_title_entry.bind("<Return>", update_callback); ttk.Label(editor_frame, text="Title:").grid(row=3, column=0, sticky="w", pady=2)
+        widgets['plot_title'] = tk.StringVar(); plot_title_entry = ttk.Entry(editor_frame, textvariable=widgets['plot_title'], width=20); plot_title_entry.grid(row=3, column=1, sticky="ew", columnspan=3); self._return_actions[plot_title_entry] = update_callback; ttk.Label(editor_frame, text="Title:").grid(row=3, column=0, sticky="w", pady=2)
         
         options_frame = ttk.Frame(editor_frame); options_frame.grid(row=4, column=0, columnspan=6, sticky='w', pady=5)
         widgets['clean_data'] = tk.BooleanVar(value=False)
@@ -507,9 +842,9 @@ class GnuplotApp:
         widgets['remove_button'] = ttk.Button(dataset_actions_frame, text="Remove Selected", state="disabled", command=lambda w=widgets, k=key: self.remove_dataset(w, k)); widgets['remove_button'].pack(side='right')
 
         axis_frame = ttk.LabelFrame(normal_frame, text="Axes Settings", padding=10); axis_frame.pack(fill='x', pady=5)
-        widgets['xlabel'] = tk.StringVar(); xlabel_entry = ttk.Entry(axis_frame, textvariable=widgets['xlabel'], width=30); xlabel_entry.grid(row=0, column=1, columnspan=5, sticky="ew"); xlabel_entry.bind("<Return>", plot_callback); ttk.Label(axis_frame, text="X-Axis Title:").grid(row=0, column=0, sticky="w", pady=2)
-        widgets['ylabel'] = tk.StringVar(); ylabel_entry = ttk.Entry(axis_frame, textvariable=widgets['ylabel'], width=30); ylabel_entry.grid(row=1, column=1, columnspan=5, sticky="ew"); ylabel_entry.bind("<Return>", plot_callback); ttk.Label(axis_frame, text="Y1-Axis Title:").grid(row=1, column=0, sticky="w", pady=2)
-        widgets['y2label'] = tk.StringVar(); y2label_entry = ttk.Entry(axis_frame, textvariable=widgets['y2label'], width=30); y2label_entry.grid(row=2, column=1, columnspan=5, sticky="ew"); y2label_entry.bind("<Return>", plot_callback); ttk.Label(axis_frame, text="Y2-Axis Title:").grid(row=2, column=0, sticky="w", pady=2)
+        widgets['xlabel'] = tk.StringVar(); xlabel_entry = ttk.Entry(axis_frame, textvariable=widgets['xlabel'], width=30); xlabel_entry.grid(row=0, column=1, columnspan=5, sticky="ew"); self._return_actions[xlabel_entry] = plot_callback; ttk.Label(axis_frame, text="X-Axis Title:").grid(row=0, column=0, sticky="w", pady=2)
+        widgets['ylabel'] = tk.StringVar(); ylabel_entry = ttk.Entry(axis_frame, textvariable=widgets['ylabel'], width=30); ylabel_entry.grid(row=1, column=1, columnspan=5, sticky="ew"); self._return_actions[ylabel_entry] = plot_callback; ttk.Label(axis_frame, text="Y1-Axis Title:").grid(row=1, column=0, sticky="w", pady=2)
+        widgets['y2label'] = tk.StringVar(); y2label_entry = ttk.Entry(axis_frame, textvariable=widgets['y2label'], width=30); y2label_entry.grid(row=2, column=1, columnspan=5, sticky="ew"); self._return_actions[y2label_entry] = plot_callback; ttk.Label(axis_frame, text="Y2-Axis Title:").grid(row=2, column=0, sticky="w", pady=2)
         widgets['x_log'] = tk.BooleanVar(); widgets['y_log'] = tk.BooleanVar(); widgets['y2_log'] = tk.BooleanVar(); widgets['grid_on'] = tk.BooleanVar(value=True); widgets['grid_style'] = tk.StringVar(value='Medium')
         
         grid_frame = ttk.Frame(axis_frame); grid_frame.grid(row=3, column=0, columnspan=6, sticky='w', pady=5)
@@ -517,212 +852,54 @@ class GnuplotApp:
         ttk.Checkbutton(grid_frame, text="Y1 Log", variable=widgets['y_log'], command=plot_callback).pack(side='left', padx=(0,10))
         ttk.Checkbutton(grid_frame, text="Y2 Log", variable=widgets['y2_log'], command=plot_callback).pack(side='left', padx=(0,10))
         ttk.Checkbutton(grid_frame, text="Grid:", variable=widgets['grid_on'], command=lambda w=widgets, k=key: self.on_grid_toggle(w, k)).pack(side='left', padx=(20, 2))
-        widgets['grid_style_combo'] = ttk.Combobox(grid_frame, textvariable=widgets['grid_style'], values=['Light', 'Medium', 'Dark'], width=8, state='normal'); widgets['grid_style_combo'].pack(side='left'); widgets['grid_style_combo'].bind("<<ComboboxSelected>>", plot_callback)
+        widgets['grid_style_combo'] = ttk.Combobox(grid_frame, textvariable=widgets['grid_style'], values=_GRID_STYLES, width=8, state='normal'); widgets['grid_style_combo'].pack(side='left'); widgets['grid_style_combo'].bind("<<ComboboxSelected>>", plot_callback)
         
         ttk.Separator(axis_frame).grid(row=4, column=0, columnspan=6, sticky='ew', pady=10)
-        ttk.Label(axis_frame, text="X-Axis Range:").grid(row=5, column=0, sticky="w"); widgets['x_range_mode'] = tk.StringVar(value='auto'); ttk.Radiobutton(axis_frame, text="Auto", variable=widgets['x_range_mode'], value='auto', command=lambda w=widgets: self.update_range_entry_state(w)).grid(row=5, column=1, sticky="w"); ttk.Radiobutton(axis_frame, text="Manual:", variable=widgets['x_range_mode'], value='manual', command=lambda w=widgets: self.update_range_entry_state(w)).grid(row=5, column=2, sticky="w"); widgets['x_min'] = tk.StringVar(); widgets['x_max'] = tk.StringVar(); widgets['x_min_entry'] = ttk.Entry(axis_frame, textvariable=widgets['x_min'], width=8, state='disabled'); widgets['x_min_entry'].grid(row=5, column=3); widgets['x_min_entry'].bind("<Return>", plot_callback); ttk.Label(axis_frame, text="to").grid(row=5, column=4, padx=5); widgets['x_max_entry'] = ttk.Entry(axis_frame, textvariable=widgets['x_max'], width=8, state='disabled'); widgets['x_max_entry'].grid(row=5, column=5); widgets['x_max_entry'].bind("<Return>", plot_callback)
-        ttk.Label(axis_frame, text="Y1-Axis Range:").grid(row=6, column=0, sticky="w"); widgets['y_range_mode'] = tk.StringVar(value='auto'); ttk.Radiobutton(axis_frame, text="Auto", variable=widgets['y_range_mode'], value='auto', command=lambda w=widgets: self.update_range_entry_state(w)).grid(row=6, column=1, sticky="w"); ttk.Radiobutton(axis_frame, text="Manual:", variable=widgets['y_range_mode'], value='manual', command=lambda w=widgets: self.update_range_entry_state(w)).grid(row=6, column=2, sticky="w"); widgets['y_min'] = tk.StringVar(); widgets['y_max'] = tk.StringVar(); widgets['y_min_entry'] = ttk.Entry(axis_frame, textvariable=widgets['y_min'], width=8, state='disabled'); widgets['y_min_entry'].grid(row=6, column=3); widgets['y_min_entry'].bind("<Return>", plot_callback); ttk.Label(axis_frame, text="to").grid(row=6, column=4, padx=5); widgets['y_max_entry'] = ttk.Entry(axis_frame, textvariable=widgets['y_max'], width=8, state='disabled'); widgets['y_max_entry'].grid(row=6, column=5); widgets['y_max_entry'].bind("<Return>", plot_callback)
-        ttk.Label(axis_frame, text="Y2-Axis Range:").grid(row=7, column=0, sticky="w"); widgets['y2_range_mode'] = tk.StringVar(value='auto'); ttk.Radiobutton(axis_frame, text="Auto", variable=widgets['y2_range_mode'], value='auto', command=lambda w=widgets: self.update_range_entry_state(w)).grid(row=7, column=1, sticky="w"); ttk.Radiobutton(axis_frame, text="Manual:", variable=widgets['y2_range_mode'], value='manual', command=lambda w=widgets: self.update_range_entry_state(w)).grid(row=7, column=2, sticky="w"); widgets['y2_min'] = tk.StringVar(); widgets['y2_max'] = tk.StringVar(); widgets['y2_min_entry'] = ttk.Entry(axis_frame, textvariable=widgets['y2_min'], width=8, state='disabled'); widgets['y2_min_entry'].grid(row=7, column=3); widgets['y2_min_entry'].bind("<Return>", plot_callback); ttk.Label(axis_frame, text="to").grid(row=7, column=4, padx=5); widgets['y2_max_entry'] = ttk.Entry(axis_frame, textvariable=widgets['y2_max'], width=8, state='disabled'); widgets['y2_max_entry'].grid(row=7, column=5); widgets['y2_max_entry'].bind("<Return>", plot_callback)
+        ttk.Label(axis_frame, text="X-Axis Range:").grid(row=5, column=0, sticky="w"); widgets['x_range_mode'] = tk.StringVar(value='auto'); ttk.Radiobutton(axis_frame, text="Auto", variable=widgets['x_range_mode'], value='auto', command=lambda w=widgets: self.update_range_entry_state(w)).grid(row=5, column=1, sticky="w"); ttk.Radiobutton(axis_frame, text="Manual:", variable=widgets['x_range_mode'], value='manual', command=lambda w=widgets: self.update_range_entry_state(w)).grid(row=5, column=2, sticky="w"); widgets['x_min'] = tk.StringVar(); widgets['x_max'] = tk.StringVar(); widgets['x_min_entry'] = ttk.Entry(axis_frame, textvariable=widgets['x_min'], width=8, state='disabled'); widgets['x_min_entry'].grid(row=5, column=3); self._return_actions[widgets['x_min_entry']] = plot_callback; ttk.Label(axis_frame, text="to").grid(row=5, column=4, padx=5); widgets['x_max_entry'] = ttk.Entry(axis_frame, textvariable=widgets['x_max'], width=8, state='disabled'); widgets['x_max_entry'].grid(row=5, column=5); self._return_actions[widgets['x_max_entry']] = plot_callback
+        ttk.Label(axis_frame, text="Y1-Axis Range:").grid(row=6, column=0, sticky="w"); widgets['y_range_mode'] = tk.StringVar(value='auto'); ttk.Radiobutton(axis_frame, text="Auto", variable=widgets['y_range_mode'], value='auto', command=lambda w=widgets: self.update_range_entry_state(w)).grid(row=6, column=1, sticky="w"); ttk.Radiobutton(axis_frame, text="Manual:", variable=widgets['y_range_mode'], value='manual', command=lambda w=widgets: self.update_range_entry_state(w)).grid(row=6, column=2, sticky="w"); widgets['y_min'] = tk.StringVar(); widgets['y_max'] = tk.StringVar(); widgets['y_min_entry'] = ttk.Entry(axis_frame, textvariable=widgets['y_min'], width=8, state='disabled'); widgets['y_min_entry'].grid(row=6, column=3); self._return_actions[widgets['y_min_entry']] = plot_callback; ttk.Label(axis_frame, text="to").grid(row=6, column=4, padx=5); widgets['y_max_entry'] = ttk.Entry(axis_frame, textvariable=widgets['y_max'], width=8, state='disabled'); widgets['y_max_entry'].grid(row=6, column=5); self._return_actions[widgets['y_max_entry']] = plot_callback
+        ttk.Label(axis_frame, text="Y2-Axis Range:").grid(row=7, column=0, sticky="w"); widgets['y2_range_mode'] = tk.StringVar(value='auto'); ttk.Radiobutton(axis_frame, text="Auto", variable=widgets['y2_range_mode'], value='auto', command=lambda w=widgets: self.update_range_entry_state(w)).grid(row=7, column=1, sticky="w"); ttk.Radiobutton(axis_frame, text="Manual:", variable=widgets['y2_range_mode'], value='manual', command=lambda w=widgets: self.update_range_entry_state(w)).grid(row=7, column=2, sticky="w"); widgets['y2_min'] = tk.StringVar(); widgets['y2_max'] = tk.StringVar(); widgets['y2_min_entry'] = ttk.Entry(axis_frame, textvariable=widgets['y2_min'], width=8, state='disabled'); widgets['y2_min_entry'].grid(row=7, column=3); self._return_actions[widgets['y2_min_entry']] = plot_callback; ttk.Label(axis_frame, text="to").grid(row=7, column=4, padx=5); widgets['y2_max_entry'] = ttk.Entry(axis_frame, textvariable=widgets['y2_max'], width=8, state='disabled'); widgets['y2_max_entry'].grid(row=7, column=5); self._return_actions[widgets['y2_max_entry']] = plot_callback
 
         layout_frame = ttk.LabelFrame(normal_frame, text="Plot Layout & Margins", padding=10)
         layout_frame.pack(fill='x', pady=5)
         widgets['use_custom_margins'] = tk.BooleanVar(value=False)
         ttk.Checkbutton(layout_frame, text="Set Custom Margins", variable=widgets['use_custom_margins'], command=lambda w=widgets: self.update_margin_entry_state(w)).grid(row=0, column=0, columnspan=4, sticky='w')
-        
-        widgets['lmargin'] = tk.StringVar(value='10')
-        widgets['rmargin'] = tk.StringVar(value='2')
-        widgets['tmargin'] = tk.StringVar(value='2')
-        widgets['bmargin'] = tk.StringVar(value='5')
-        
-        lmargin_spinbox = ttk.Spinbox(layout_frame, from_=0, to=1000, increment=1, textvariable=widgets['lmargin'], width=7, state='disabled', command=plot_callback)
-        lmargin_spinbox.grid(row=1, column=1); lmargin_spinbox.bind("<Return>", plot_callback); widgets['lmargin_entry'] = lmargin_spinbox
-        ttk.Label(layout_frame, text="Left (+):").grid(row=1, column=0, sticky='w')
-
-        rmargin_spinbox = ttk.Spinbox(layout_frame, from_=0, to=1000, increment=1, textvariable=widgets['rmargin'], width=7, state='disabled', command=plot_callback)
-        rmargin_spinbox.grid(row=1, column=3); rmargin_spinbox.bind("<Return>", plot_callback); widgets['rmargin_entry'] = rmargin_spinbox
-        ttk.Label(layout_frame, text="Right (-):").grid(row=1, column=2, sticky='w')
-
-        tmargin_spinbox = ttk.Spinbox(layout_frame, from_=0, to=1000, increment=1, textvariable=widgets['tmargin'], width=7, state='disabled', command=plot_callback)
-        tmargin_spinbox.grid(row=2, column=1); tmargin_spinbox.bind("<Return>", plot_callback); widgets['tmargin_entry'] = tmargin_spinbox
-        ttk.Label(layout_frame, text="Top (-):").grid(row=2, column=0, sticky='w')
-
-        bmargin_spinbox = ttk.Spinbox(layout_frame, from_=0, to=1000, increment=1, textvariable=widgets['bmargin'], width=7, state='disabled', command=plot_callback)
-        bmargin_spinbox.grid(row=2, column=3); bmargin_spinbox.bind("<Return>", plot_callback); widgets['bmargin_entry'] = bmargin_spinbox
-        ttk.Label(layout_frame, text="Bottom (+):").grid(row=2, column=2, sticky='w')
-        
-        ttk.Separator(layout_frame).grid(row=3, column=0, columnspan=4, sticky='ew', pady=10)
-        widgets['lock_aspect_ratio'] = tk.BooleanVar(value=True)
-        ttk.Checkbutton(layout_frame, text="Aspect ratio (height / width):", variable=widgets['lock_aspect_ratio'], command=lambda w=widgets: self.update_aspect_ratio_entry_state(w)).grid(row=4, column=0, columnspan=2, sticky='w')
-        widgets['aspect_ratio'] = tk.StringVar(value='0.75')
-        widgets['aspect_ratio_entry'] = ttk.Entry(layout_frame, textvariable=widgets['aspect_ratio'], width=8, state='normal')
-        widgets['aspect_ratio_entry'].grid(row=4, column=2)
-        widgets['aspect_ratio_entry'].bind("<Return>", plot_callback)
-        
-        # --- Normal Mode Actions ---
-        main_action_frame = ttk.Frame(normal_frame); main_action_frame.pack(fill='x', pady=10)
-        ttk.Button(main_action_frame, text="Plot / Refresh", command=lambda w=widgets, k=key: self.plot(w, k)).pack(pady=5)
-        
-        replot_frame = ttk.Frame(normal_frame); replot_frame.pack(fill='x', pady=5)
-        widgets['replot_interval'] = tk.StringVar(value='1000'); ttk.Label(replot_frame, text="Auto (ms):").pack(side='left'); ttk.Entry(replot_frame, textvariable=widgets['replot_interval'], width=8).pack(side='left', padx=5); widgets['start_button'] = ttk.Button(replot_frame, text="Start", command=lambda w=widgets, k=key: self.start_replot(w, k)); widgets['start_button'].pack(side='left'); widgets['stop_button'] = ttk.Button(replot_frame, text="Stop", state="disabled", command=lambda w=widgets: self.stop_replot(w)); widgets['stop_button'].pack(side='left', padx=5)
-
-        # --- LOGFILE MODE WIDGETS ---
-        logfile_frame = widgets['logfile_mode_frame']
-
-        logfile_selection_frame = ttk.LabelFrame(logfile_frame, text="Logfile Selection", padding=10)
-        logfile_selection_frame.pack(fill='x', pady=5)
-        widgets['logfile_path'] = tk.StringVar()
-        ttk.Label(logfile_selection_frame, text="Logfile:").grid(row=0, column=0, sticky='w')
-        ttk.Entry(logfile_selection_frame, textvariable=widgets['logfile_path']).grid(row=0, column=1, sticky='ew')
-        ttk.Button(logfile_selection_frame, text="Browse...", command=lambda w=widgets: self._browse_logfile(w)).grid(row=0, column=2, padx=5)
-        ttk.Button(logfile_selection_frame, text="Parse Logfile", command=lambda w=widgets, k=key: self._parse_logfile(w, k)).grid(row=1, column=1, pady=5)
-        logfile_selection_frame.columnconfigure(1, weight=1)
-
-        # Logfile Layout & Grid
-        logfile_layout_frame = ttk.LabelFrame(logfile_frame, text="Layout, Margins & Grid", padding=10)
-        logfile_layout_frame.pack(fill='x', pady=5)
-        
-        # --- Margins ---
-        ttk.Label(logfile_layout_frame, text="Margins:").grid(row=0, column=0, sticky='w', rowspan=2)
-        
-        ttk.Label(logfile_layout_frame, text="Left").grid(row=0, column=1, sticky='s', padx=2)
-        ttk.Label(logfile_layout_frame, text="Right").grid(row=0, column=2, sticky='s', padx=2)
-        ttk.Label(logfile_layout_frame, text="Bottom").grid(row=0, column=3, sticky='s', padx=2)
-        ttk.Label(logfile_layout_frame, text="Top").grid(row=0, column=4, sticky='s', padx=2)
-
-        widgets['logfile_lmargin'] = tk.StringVar(value='0.1'); widgets['logfile_rmargin'] = tk.StringVar(value='0.9'); widgets['logfile_bmargin'] = tk.StringVar(value='0.1'); widgets['logfile_tmargin'] = tk.StringVar(value='0.9')
-        
-        lmargin_spin = ttk.Spinbox(logfile_layout_frame, from_=0.0, to=1.0, increment=0.05, textvariable=widgets['logfile_lmargin'], width=5, command=plot_callback)
-        lmargin_spin.grid(row=1, column=1, padx=2)
-        lmargin_spin.bind("<Return>", plot_callback)
-        
-        rmargin_spin = ttk.Spinbox(logfile_layout_frame, from_=0.0, to=1.0, increment=0.05, textvariable=widgets['logfile_rmargin'], width=5, command=plot_callback)
-        rmargin_spin.grid(row=1, column=2, padx=2)
-        rmargin_spin.bind("<Return>", plot_callback)
-
-        bmargin_spin = ttk.Spinbox(logfile_layout_frame, from_=0.0, to=1.0, increment=0.05, textvariable=widgets['logfile_bmargin'], width=5, command=plot_callback)
-        bmargin_spin.grid(row=1, column=3, padx=2)
-        bmargin_spin.bind("<Return>", plot_callback)
-        
-        tmargin_spin = ttk.Spinbox(logfile_layout_frame, from_=0.0, to=1.0, increment=0.05, textvariable=widgets['logfile_tmargin'], width=5, command=plot_callback)
-        tmargin_spin.grid(row=1, column=4, padx=2)
-        tmargin_spin.bind("<Return>", plot_callback)
-
-        # --- Spacing ---
-        ttk.Label(logfile_layout_frame, text="Spacing (X, Y):").grid(row=2, column=0, sticky='w', pady=(5,2))
-        widgets['logfile_xspacing'] = tk.StringVar(value='0.08'); widgets['logfile_yspacing'] = tk.StringVar(value='0.08')
-
-        xspacing_spin = ttk.Spinbox(logfile_layout_frame, from_=0.0, to=1.0, increment=0.01, textvariable=widgets['logfile_xspacing'], width=5, command=plot_callback)
-        xspacing_spin.grid(row=2, column=1, padx=2)
-        xspacing_spin.bind("<Return>", plot_callback)
-
-        yspacing_spin = ttk.Spinbox(logfile_layout_frame, from_=0.0, to=1.0, increment=0.01, textvariable=widgets['logfile_yspacing'], width=5, command=plot_callback)
-        yspacing_spin.grid(row=2, column=2, padx=2)
-        yspacing_spin.bind("<Return>", plot_callback)
-
-        # --- Grid ---
-        ttk.Label(logfile_layout_frame, text="Grid:").grid(row=3, column=0, sticky='w', pady=2)
-        widgets['logfile_grid_on'] = tk.BooleanVar(value=True); widgets['logfile_grid_style'] = tk.StringVar(value='Medium')
-        ttk.Checkbutton(logfile_layout_frame, text="On", variable=widgets['logfile_grid_on'], command=plot_callback).grid(row=3, column=1, sticky='w')
-        grid_combo = ttk.Combobox(logfile_layout_frame, textvariable=widgets['logfile_grid_style'], values=['Light', 'Medium', 'Dark'], width=8)
-        grid_combo.grid(row=3, column=2, columnspan=2, sticky='w')
-        grid_combo.bind("<<ComboboxSelected>>", plot_callback)
-
-        # --- Logfile Mode Actions (Moved Up) ---
-        logfile_action_frame = ttk.LabelFrame(logfile_frame, text="Plot Actions", padding=10)
-        logfile_action_frame.pack(fill='x', pady=5)
-        
-        logfile_main_action_frame = ttk.Frame(logfile_action_frame); logfile_main_action_frame.pack(pady=2)
-        ttk.Button(logfile_main_action_frame, text="Plot / Refresh", command=lambda w=widgets, k=key: self.refresh_and_plot(w, k)).pack()
-        
-        logfile_replot_frame = ttk.Frame(logfile_action_frame); logfile_replot_frame.pack(pady=2)
-        widgets['logfile_replot_interval'] = tk.StringVar(value='1000')
-        ttk.Label(logfile_replot_frame, text="Auto (ms):").pack(side='left')
-        ttk.Entry(logfile_replot_frame, textvariable=widgets['logfile_replot_interval'], width=8).pack(side='left', padx=5)
-        widgets['logfile_start_button'] = ttk.Button(logfile_replot_frame, text="Start", command=lambda w=widgets, k=key: self.start_replot(w, k)); widgets['logfile_start_button'].pack(side='left')
-        widgets['logfile_stop_button'] = ttk.Button(logfile_replot_frame, text="Stop", state="disabled", command=lambda w=widgets: self.stop_replot(w)); widgets['logfile_stop_button'].pack(side='left', padx=5)
-
-        subplot_config_frame = ttk.LabelFrame(logfile_frame, text="Sub-plot Configuration", padding=10)
-        subplot_config_frame.pack(fill='x', pady=5, expand=True)
-        
-        widgets['subplot_vars'] = []
-        
-        for i in range(4):
-            title = ["Top-Left", "Top-Right", "Bottom-Left", "Bottom-Right"][i]
-            
-            sub_frame = ttk.LabelFrame(subplot_config_frame, text=f"Sub-plot {i+1} ({title})", padding=10)
-            sub_frame.grid(row=i, column=0, sticky='ew', padx=5, pady=5)
-            subplot_config_frame.columnconfigure(0, weight=1)
-
-            # --- Row 0: Labels and Options ---
-            top_frame = ttk.Frame(sub_frame); top_frame.pack(fill='x')
-            
-            y_label_var = tk.StringVar()
-            ttk.Label(top_frame, text="Y-Axis Label:").pack(side='left')
-            y_label_entry = ttk.Entry(top_frame, textvariable=y_label_var, width=20)
-            y_label_entry.pack(side='left', fill='x', expand=True, padx=5)
-            y_label_entry.bind("<Return>", plot_callback)
-            
-            y_log_var = tk.BooleanVar(value=False)
-            ttk.Checkbutton(top_frame, text="Y Log", variable=y_log_var, command=plot_callback).pack(side='left', padx=5)
-
-            show_legend_var = tk.BooleanVar(value=True)
-            ttk.Checkbutton(top_frame, text="Show Legend", variable=show_legend_var, command=plot_callback).pack(side='left', padx=5)
-            
-            # --- Row 1 & 2: Axis Ranges ---
-            range_frame = ttk.Frame(sub_frame); range_frame.pack(fill='x', pady=5)
-            
-            def create_range_controls(parent, axis_name, row, plot_cb):
-                ttk.Label(parent, text=f"{axis_name}-Axis Range:").grid(row=row, column=0, sticky="w")
-                range_mode_var = tk.StringVar(value='auto')
-                min_var = tk.StringVar(); max_var = tk.StringVar()
-                
-                min_entry = ttk.Entry(parent, textvariable=min_var, width=8, state='disabled')
-                max_entry = ttk.Entry(parent, textvariable=max_var, width=8, state='disabled')
-
-                def update_state():
-                    state = 'normal' if range_mode_var.get() == 'manual' else 'disabled'
-                    min_entry.config(state=state)
-                    max_entry.config(state=state)
-                
-                def update_and_plot():
-                    update_state()
-                    plot_cb()
-
-                ttk.Radiobutton(parent, text="Auto", variable=range_mode_var, value='auto', command=update_and_plot).grid(row=row, column=1, sticky="w")
-                ttk.Radiobutton(parent, text="Manual:", variable=range_mode_var, value='manual', command=update_and_plot).grid(row=row, column=2, sticky="w")
-                min_entry.grid(row=row, column=3, padx=2)
-                ttk.Label(parent, text="to").grid(row=row, column=4, padx=2)
-                max_entry.grid(row=row, column=5, padx=2)
-                
-                min_entry.bind("<Return>", plot_cb)
-                max_entry.bind("<Return>", plot_cb)
+        
+        widgets['lmargin'] = tk.StringVar(value='10')
+        widgets['rmargin'] = tk.StringVar(value='2')
+        widgets['tmargin'] = tk.StringVar(value='2')
+        widgets['bmargin'] = tk.StringVar(value='5')
+        
+        lmargin_spinbox = ttk.Spinbox(layout_frame, from_=0, to=1000, increment=1, textvariable=widgets['lmargin'], width=7, state='disabled', command=plot_callback)
+        lmargin_spinbox.grid(row=1, column=1); self._return_actions[lmargin_spinbox] = plot_callback; widgets['lmargin_entry'] = lmargin_spinbox
+        ttk.Label(layout_frame, text="Left (+):").grid(row=1, column=0, sticky='w')
 
-                return {
-                    'mode': range_mode_var, 'min': min_var, 'max': max_var,
-                    'min_entry': min_entry, 'max_entry': max_entry
-                }
+        rmargin_spinbox = ttk.Spinbox(layout_frame, from_=0, to=1000, increment=1, textvariable=widgets['rmargin'], width=7, state='disabled', command=plot_callback)
+        rmargin_spinbox.grid(row=1, column=3); self._return_actions[rmargin_spinbox] = plot_callback; widgets['rmargin_entry'] = rmargin_spinbox
+        ttk.Label(layout_frame, text="Right (-):").grid(row=1, column=2, sticky='w')
 
-            x_range_vars = create_range_controls(range_frame, 'X', 0, plot_callback)
-            y_range_vars = create_range_controls(range_frame, 'Y', 1, plot_callback)
+        tmargin_spinbox = ttk.Spinbox(layout_frame, from_=0, to=1000, increment=1, textvariable=widgets['tmargin'], width=7, state='disabled', command=plot_callback)
+        tmargin_spinbox.grid(row=2, column=1); self._return_actions[tmargin_spinbox] = plot_callback; widgets['tmargin_entry'] = tmargin_spinbox
+        ttk.Label(layout_frame, text="Top (-):").grid(row=2, column=0, sticky='w')
 
-            # --- Row 3: Column Selection Listbox ---
-            ttk.Label(sub_frame, text="Y-Axis Columns:").pack(anchor='w', pady=(5,0))
-            list_frame = ttk.Frame(sub_frame); list_frame.pack(fill='both', expand=True)
-            listbox = tk.Listbox(list_frame, selectmode='multiple', height=5, exportselection=False)
-            listbox.pack(side='left', fill='both', expand=True)
-            list_scroll = ttk.Scrollbar(list_frame, orient='vertical', command=listbox.yview); list_scroll.pack(side='right', fill='y')
-            listbox.config(yscrollcommand=list_scroll.set)
-            listbox.bind("<<ListboxSelect>>", plot_callback)
+        bmargin_spinbox = ttk.Spinbox(layout_frame, from_=0, to=1000, increment=1, textvariable=widgets['bmargin'], width=7, state='disabled', command=plot_callback)
+        bmargin_spinbox.grid(row=2, column=3); self._return_actions[bmargin_spinbox] = plot_callback; widgets['bmargin_entry'] = bmargin_spinbox
+        ttk.Label(layout_frame, text="Bottom (+):").grid(row=2, column=2, sticky='w')
+        
+        ttk.Separator(layout_frame).grid(row=3, column=0, columnspan=4, sticky='ew', pady=10)
+        widgets['lock_aspect_ratio'] = tk.BooleanVar(value=True)
+        ttk.Checkbutton(layout_frame, text="Aspect ratio (height / width):", variable=widgets['lock_aspect_ratio'], command=lambda w=widgets: self.update_aspect_ratio_entry_state(w)).grid(row=4, column=0, columnspan=2, sticky='w')
+        widgets['aspect_ratio'] = tk.StringVar(value='0.75')
+        widgets['aspect_ratio_entry'] = ttk.Entry(layout_frame, textvariable=widgets['aspect_ratio'], width=8, state='normal')
+        widgets['aspect_ratio_entry'].grid(row=4, column=2)
+        self._return_actions[widgets['aspect_ratio_entry']] = plot_callback
+        
+        # --- Normal Mode Actions ---
+        main_action_frame = ttk.Frame(normal_frame); main_action_frame.pack(fill='x', pady=10)
+        ttk.Button(main_action_frame, text="Plot / Refresh", command=lambda w=widgets, k=key: self.plot(w, k)).pack(pady=5)
+        
+        replot_frame = ttk.Frame(normal_frame); replot_frame.pack(fill='x', pady=5)
+        widgets['replot_interval'] = tk.StringVar(value='1000'); ttk.Label(replot_frame, text="Auto (ms):").pack(side='left'); ttk.Entry(replot_frame, textvariable=widgets['replot_interval'], width=8).pack(side='left', padx=5); widgets['start_button'] = ttk.Button(replot_frame, text="Start", command=lambda w=widgets, k=key: self.start_replot(w, k)); widgets['start_button'].pack(side='left'); widgets['stop_button'] = ttk.Button(replot_frame, text="Stop", state="disabled", command=lambda w=widgets, k=key: self.stop_replot(w, k)); widgets['stop_button'].pack(side='left', padx=5)
 
-            widgets['subplot_vars'].append({
-                'y_label': y_label_var, 
-                'y_log': y_log_var,
-                'show_legend': show_legend_var,
-                'x_range': x_range_vars,
-                'y_range': y_range_vars,
-                'listbox': listbox
-            })
-            
         # --- COMMON WIDGETS (Plot Display & Close Tab) ---
         ttk.Separator(controls_frame).pack(fill='x', pady=10)
         ttk.Button(controls_frame, text="Close Tab", command=lambda k=key: self.close_tab(k)).pack()
@@ -746,9 +923,13 @@ class GnuplotApp:
             'plot_height': 400, 
             'resize_job': None, 
             'frame': tab_frame,
+            'frame_path': str(tab_frame),
             'paned_window': paned_window,
             'plot_display_panedwindow': plot_display_panedwindow,
             'log_viewer_frame': log_viewer_frame,
+            # The pane is added at construction above; the initial
+            # _switch_mode to Normal detaches it.
+            'log_viewer_attached': True,
             'temp_file_path': None,
             'logfile_df': None,
             'parsed_byte_offset': 0,
@@ -756,10 +937,26 @@ class GnuplotApp:
             'monitored_columns': None, # New: To store user's selection
             'stop_tailing': threading.Event(),
             'tail_thread': None,
-            'logfile_monitor_job': None
+            'logfile_monitor_job': None,
+            'gnuplot_proc': None,
+            'gnuplot_lock': threading.Lock(),
+            'plot_queue': queue.Queue(maxsize=1),
+            'auto_replotting': False,
+            'replot_job': None,
+            'replot_next_t': 0.0
         }
+        # Per-keystroke numeric validation on the free-form numeric fields
+        for entry_key in ('x_min_entry', 'x_max_entry', 'y_min_entry', 'y_max_entry',
+                          'y2_min_entry', 'y2_max_entry', 'aspect_ratio_entry'):
+            widgets[entry_key].config(validate='key', validatecommand=self._vcmd_float)
+        for entry_key in ('lmargin_entry', 'rmargin_entry', 'tmargin_entry', 'bmargin_entry'):
+            widgets[entry_key].config(validate='key', validatecommand=self._vcmd_int)
+
         plot_image_frame.bind("<Configure>", lambda event, k=key: self.on_plot_resize(event, k))
         self.tabs[key] = tab_data
+
+        # Per-tab worker so gnuplot runs never block the Tk mainloop
+        threading.Thread(target=self._plot_worker, args=(key,), daemon=True).start()
         
         self._switch_mode(widgets, key) # Set initial view
         return tab_frame
@@ -800,24 +997,45 @@ class GnuplotApp:
             with open(filepath, 'r') as f:
                 f.seek(0, 2) # Go to the end of the file
                 while not stop_event.is_set():
-                    line = f.readline()
-                    if line:
-                        q.put((key, line))
+                    # Drain everything available in one go: a solver that
+                    # writes dozens of lines per time step produces one
+                    # queue item, not one wakeup per line.
+                    lines = f.readlines()
+                    if lines:
+                        q.put((key, ''.join(lines)))
                     else:
                         time.sleep(0.1) # Wait for new lines
         except Exception as e:
             print(f"Error in tail worker for {key}: {e}")
 
+    # Keep at most this many lines in a log viewer; older ones are trimmed
+    # so a days-long tail cannot grow the Text widget without bound.
+    _LOG_TEXT_MAX_LINES = 5000
+
     def _process_log_queue(self):
         try:
-            while not self.log_queue.empty():
-                key, line = self.log_queue.get_nowait()
-                if key in self.tabs:
-                    text_widget = self.tabs[key]['widgets']['log_text_widget']
-                    text_widget.config(state='normal')
-                    text_widget.insert('end', line)
-                    text_widget.see('end')
-                    text_widget.config(state='disabled')
+            # Drain the whole queue first, grouping by tab, so each tab
+            # pays one state toggle / insert / scroll per tick instead of
+            # one set per queued chunk.
+            pending = {}
+            while True:
+                try:
+                    key, text = self.log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                pending.setdefault(key, []).append(text)
+
+            for key, parts in pending.items():
+                if key not in self.tabs:
+                    continue
+                text_widget = self.tabs[key]['widgets']['log_text_widget']
+                text_widget.config(state='normal')
+                text_widget.insert('end', ''.join(parts))
+                line_count = int(text_widget.index('end-1c').split('.')[0])
+                if line_count > self._LOG_TEXT_MAX_LINES:
+                    text_widget.delete('1.0', f'{line_count - self._LOG_TEXT_MAX_LINES + 1}.0')
+                text_widget.see('end')
+                text_widget.config(state='disabled')
         finally:
             self.root.after(100, self._process_log_queue)
 
@@ -833,13 +1051,10 @@ class GnuplotApp:
             return
 
         # --- New logic to wait for file to populate ---
-        with open(logfile_path, 'r') as f:
-            time_blocks = [line for line in f if re.match(r"^\s*Time = (\S+)\s*$", line)]
-        
-        if len(time_blocks) < 3:
+        if self._count_time_blocks(logfile_path) < 3:
             self._wait_for_logfile_data(widgets, key, logfile_path, 0)
         else:
-            self._execute_full_parse(widgets, key, logfile_path)
+            self._execute_full_parse_async(widgets, key, logfile_path)
 
     def _wait_for_logfile_data(self, widgets, key, filepath, checks_done):
         tab_data = self.tabs[key]
@@ -852,6 +1067,7 @@ class GnuplotApp:
             messagebox.showinfo("Monitoring Logfile", "Logfile has fewer than three 'Time' blocks. Monitoring for changes...")
             tab_data['last_mtime'] = os.path.getmtime(filepath)
             tab_data['stale_time'] = 0
+            tab_data['time_block_scan'] = {'offset': 0, 'count': 0}
 
         try:
             current_mtime = os.path.getmtime(filepath)
@@ -864,11 +1080,26 @@ class GnuplotApp:
                 tab_data['last_mtime'] = current_mtime
                 tab_data['stale_time'] = 0
 
-            with open(filepath, 'r') as f:
-                time_blocks = [line for line in f if re.match(r"^\s*Time = (\S+)\s*$", line)]
-            
-            if len(time_blocks) >= 3:
-                self._execute_full_parse(widgets, key, filepath)
+            # Count Time blocks incrementally: each poll scans only the
+            # bytes appended since the previous one, restarting if the
+            # file was truncated or rewritten.
+            scan = tab_data['time_block_scan']
+            if os.path.getsize(filepath) < scan['offset']:
+                scan['offset'] = 0
+                scan['count'] = 0
+            with open(filepath, 'rb') as f:
+                f.seek(scan['offset'])
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break  # partial line; re-read on the next poll
+                    scan['offset'] += len(line)
+                    if b'Time =' in line and _TIME_RE.match(line.decode('ascii', 'replace')):
+                        scan['count'] += 1
+                        if scan['count'] >= 3:
+                            break
+
+            if scan['count'] >= 3:
+                self._execute_full_parse_async(widgets, key, filepath)
                 return
 
         except FileNotFoundError:
@@ -878,18 +1109,50 @@ class GnuplotApp:
         # Reschedule check
         tab_data['logfile_monitor_job'] = self.root.after(2000, lambda: self._wait_for_logfile_data(widgets, key, filepath, checks_done + 1))
 
+    @staticmethod
+    def _count_time_blocks(filepath, limit=3):
+        """Count 'Time = ...' lines, stopping once `limit` are found."""
+        count = 0
+        with open(filepath, 'r') as f:
+            for line in f:
+                if 'Time =' in line and _TIME_RE.match(line):
+                    count += 1
+                    if count >= limit:
+                        break
+        return count
+
     def _downcast_dataframe(self, df):
         """Downcast numeric columns of a DataFrame to save memory."""
-        for col in df.columns:
-            if df[col].dtype == 'float64':
-                df[col] = pd.to_numeric(df[col], downcast='float')
-            elif df[col].dtype == 'int64':
-                df[col] = pd.to_numeric(df[col], downcast='integer')
+        float_cols = df.select_dtypes(include='float64').columns
+        if len(float_cols):
+            df[float_cols] = df[float_cols].astype('float32')
+        int_cols = df.select_dtypes(include='int64').columns
+        if len(int_cols):
+            lows, highs = df[int_cols].min(), df[int_cols].max()
+            for col in int_cols:
+                for dtype in ('int8', 'int16', 'int32'):
+                    info = np.iinfo(dtype)
+                    if lows[col] >= info.min and highs[col] <= info.max:
+                        df[col] = df[col].astype(dtype)
+                        break
         return df
 
-    def _execute_full_parse(self, widgets, key, logfile_path, silent=False):
-        parser = LogfileParser(logfile_path)
-        df, error, byte_offset = parser.parse()
+    def _execute_full_parse_async(self, widgets, key, logfile_path):
+        """Run the heavy parse off the Tk thread and finish back on it.
+
+        Interactive parses go through here so a large logfile cannot
+        freeze the UI; session load runs its parses through a thread
+        pool instead, one per restored tab.
+        """
+        def parse_worker():
+            df, error, byte_offset = LogfileParser(logfile_path).parse()
+            self.root.after(0, self._finish_full_parse, widgets, key, df, error, byte_offset, False)
+
+        threading.Thread(target=parse_worker, daemon=True).start()
+
+    def _finish_full_parse(self, widgets, key, df, error, byte_offset, silent):
+        if key not in self.tabs:
+            return False
         tab_data = self.tabs[key]
 
         if error:
@@ -925,21 +1188,23 @@ class GnuplotApp:
         residual_cols = sorted([c for c in monitored_columns if 'initial_residual' in c])
         other_cols = sorted([c for c in monitored_columns if 'initial_residual' not in c])
         sorted_cols = residual_cols + other_cols
-        
-        tab_data['logfile_columns'] = sorted_cols
-        
-        for i in range(4):
-            listbox = widgets['subplot_vars'][i]['listbox']
-            selected = [listbox.get(idx) for idx in listbox.curselection()]
-            listbox.delete(0, 'end')
-            for col in sorted_cols:
-                listbox.insert('end', col)
-            for item in selected:
-                try:
-                    idx = sorted_cols.index(item)
-                    listbox.selection_set(idx)
-                except ValueError:
-                    pass
+
+        # Re-parsing the same file yields the same columns; leave the
+        # listboxes (and their selections) untouched in that case.
+        if sorted_cols != tab_data.get('logfile_columns'):
+            tab_data['logfile_columns'] = sorted_cols
+            col_index = {c: i for i, c in enumerate(sorted_cols)}
+
+            for i in range(4):
+                listbox = widgets['subplot_vars'][i]['listbox']
+                selected = [listbox.get(idx) for idx in listbox.curselection()]
+                listbox.delete(0, 'end')
+                if sorted_cols:
+                    listbox.insert('end', *sorted_cols)
+                for item in selected:
+                    idx = col_index.get(item)
+                    if idx is not None:
+                        listbox.selection_set(idx)
 
         if not silent:
             self._start_log_tail(key, logfile_path)
@@ -954,33 +1219,59 @@ class GnuplotApp:
             return False
 
         try:
+            # One stat gates the whole tick: steady-state files skip the
+            # open/seek/read entirely.
+            st = os.stat(logfile_path)
+            stat_sig = (st.st_mtime_ns, st.st_size)
+            if tab_data.get('last_tail_stat') == stat_sig:
+                return True
+            tab_data['last_tail_stat'] = stat_sig
+
             with open(logfile_path, 'r') as f:
                 f.seek(tab_data['parsed_byte_offset'])
-                new_lines = f.readlines()
+                new_text = f.read()
                 new_offset = f.tell()
-            
-            if not new_lines:
+
+            if not new_text:
                 return True # Nothing new to parse
 
-            parser = LogfileParser()
-            new_records = parser.parse_lines(new_lines, monitored_columns=tab_data['monitored_columns'])
+            new_columns = _LOG_PARSER.parse_lines((new_text,), monitored_columns=tab_data['monitored_columns'])
 
-            if not new_records:
+            if not new_columns:
                 tab_data['parsed_byte_offset'] = new_offset
                 return True
 
-            new_df = pd.DataFrame.from_records(new_records)
+            new_df = pd.DataFrame(new_columns)
             new_df = self._downcast_dataframe(new_df)
             
-            combined_df = pd.concat([tab_data['logfile_df'], new_df], ignore_index=True)
-            combined_df = combined_df.ffill()
-            combined_df = combined_df.sort_values(by='Time').drop_duplicates(subset='Time', keep='last')
-            
+            old_df = tab_data['logfile_df']
+            time_new = new_df['Time']
+            if len(old_df) and time_new.is_monotonic_increasing and time_new.iloc[0] > old_df['Time'].iloc[-1]:
+                # Fast path: strictly newer, in-order rows — the usual case
+                # for a running simulation. Forward-fill and deduplicate the
+                # new block only (seeded with the last known row), so the
+                # tick costs O(new rows) instead of O(history).
+                block = pd.concat([old_df.iloc[-1:], new_df], ignore_index=True).ffill().iloc[1:]
+                block = block.loc[block['Time'].ne(block['Time'].shift(-1))]
+                combined_df = pd.concat([old_df, block], ignore_index=True)
+                appended = block
+            else:
+                combined_df = _LOG_PARSER._finalize_frame(pd.concat([old_df, new_df], ignore_index=True))
+                n_old = len(old_df)
+                if len(combined_df) >= n_old and combined_df.iloc[:n_old].equals(old_df):
+                    appended = combined_df.iloc[n_old:]
+                else:
+                    appended = None  # earlier rows changed; rewrite below
+
             tab_data['logfile_df'] = combined_df
             tab_data['parsed_byte_offset'] = new_offset
 
-            with open(tab_data['temp_file_path'], 'w', newline='') as tmpfile:
-                combined_df.to_csv(tmpfile, index=False)
+            if appended is not None:
+                if not appended.empty:
+                    appended.to_csv(tab_data['temp_file_path'], mode='a', header=False, index=False)
+            else:
+                with open(tab_data['temp_file_path'], 'w', newline='') as tmpfile:
+                    combined_df.to_csv(tmpfile, index=False)
 
             return True
 
@@ -1016,17 +1307,55 @@ class GnuplotApp:
         widgets['grid_style_combo'].config(state=state)
         self.plot(widgets, key)
 
+    def _debounced_plot(self, widgets, key, event=None):
+        """Trailing-edge 150 ms debounce for bursty widget events.
+
+        `event` absorbs the argument Tk passes to bound handlers, so the
+        same per-tab partial serves both `command=` and `bind` callers.
+        """
+        tab_data = self.tabs[key]
+        if tab_data.get('plot_debounce_job'):
+            self.root.after_cancel(tab_data['plot_debounce_job'])
+
+        def fire_plot():
+            if key not in self.tabs:
+                return
+            self.tabs[key]['plot_debounce_job'] = None
+            self.plot(widgets, key)
+
+        tab_data['plot_debounce_job'] = self.root.after(150, fire_plot)
+
+    def _schedule_plot(self, widgets, key):
+        """Coalesce bursts of UI changes into a single idle-time replot."""
+        tab_data = self.tabs[key]
+        if tab_data.get('plot_pending'):
+            return
+        tab_data['plot_pending'] = True
+
+        def run_pending_plot():
+            if key not in self.tabs:
+                return
+            self.tabs[key]['plot_pending'] = False
+            self.plot(widgets, key)
+
+        self.root.after_idle(run_pending_plot)
+
     def toggle_checkbox(self, event, widgets, key):
         tree = widgets['tree']; region = tree.identify_region(event.x, event.y)
         if region != "tree": return
         item_id = tree.focus()
         if not item_id: return
-        current_tags = list(tree.item(item_id, "tags"))
-        if "checked" in current_tags: current_tags.remove("checked"); current_tags.append("unchecked"); tree.item(item_id, text="☐")
+        # Tags hold the dataset filepath plus one state tag; swap the state
+        # tag without the list-copy/remove/append round trip.
+        tags = tree.item(item_id, "tags")
+        if "checked" in tags:
+            new_tags = tuple(t for t in tags if t != "checked") + ("unchecked",); text = "☐"
         else:
-            if "unchecked" in current_tags: current_tags.remove("unchecked")
-            current_tags.append("checked"); tree.item(item_id, text="☑")
-        tree.item(item_id, tags=tuple(current_tags)); self.plot(widgets, key)
+            new_tags = tuple(t for t in tags if t != "unchecked") + ("checked",); text = "☑"
+        # One Tcl update for the row, and the replot runs at idle time so
+        # the click handler returns immediately.
+        tree.item(item_id, tags=new_tags, text=text)
+        self._schedule_plot(widgets, key)
 
     def update_range_entry_state(self, widgets):
         widgets['x_min_entry'].config(state='normal' if widgets['x_range_mode'].get() == 'manual' else 'disabled'); widgets['x_max_entry'].config(state='normal' if widgets['x_range_mode'].get() == 'manual' else 'disabled')
@@ -1075,246 +1404,484 @@ class GnuplotApp:
         margin_cmd = f"margins {widgets['logfile_lmargin'].get()}, {widgets['logfile_rmargin'].get()}, {widgets['logfile_bmargin'].get()}, {widgets['logfile_tmargin'].get()}"
         spacing_cmd = f"spacing {widgets['logfile_xspacing'].get()}, {widgets['logfile_yspacing'].get()}"
 
-        script = f"""
+        output_settings = f"set output '{terminal_config['output']}'" if terminal_config.get('output') else "unset output"
+        parts = [f"""
             set terminal {terminal_config['term']} size {terminal_config['size']} enhanced font 'Verdana,10'
-            set output '{terminal_config['output']}'
+            {output_settings}
             set datafile separator ","
             set multiplot layout 2,2 {margin_cmd} {spacing_cmd}
-        """
-        
+        """]
+
         if widgets['logfile_grid_on'].get():
-            color_map = {'Light': 'gray80', 'Medium': 'gray50', 'Dark': 'gray20'}
-            grid_color = color_map.get(widgets['logfile_grid_style'].get(), 'gray50')
-            script += f'set grid back linetype 0 linecolor "{grid_color}"\n'
+            grid_color = _LOGFILE_GRID_COLORS.get(widgets['logfile_grid_style'].get(), 'gray50')
+            parts.append(f'set grid back linetype 0 linecolor "{grid_color}"\n')
         else:
-            script += 'unset grid\n'
+            parts.append('unset grid\n')
 
         has_plot = False
         for i in range(4):
             sub_plot_vars = widgets['subplot_vars'][i]
-            script += f'\n# Subplot {i+1}\n'
-            
+            parts.append(f'\n# Subplot {i+1}\n')
+
             # Key (Legend)
-            script += 'set key on\n' if sub_plot_vars['show_legend'].get() else 'set key off\n'
+            parts.append('set key on\n' if sub_plot_vars['show_legend'].get() else 'set key off\n')
 
-            # Ranges
+            # Ranges — read each Tk variable once
             x_range = sub_plot_vars['x_range']; y_range = sub_plot_vars['y_range']
-            if x_range['mode'].get() == 'manual' and x_range['min'].get() and x_range['max'].get(): script += f"set xrange [{x_range['min'].get()}:{x_range['max'].get()}]\n"
-            else: script += "set autoscale x\n"
-            if y_range['mode'].get() == 'manual' and y_range['min'].get() and y_range['max'].get(): script += f"set yrange [{y_range['min'].get()}:{y_range['max'].get()}]\n"
-            else: script += "set autoscale y\n"
+            x_min, x_max = x_range['min'].get(), x_range['max'].get()
+            if x_range['mode'].get() == 'manual' and x_min and x_max: parts.append(f"set xrange [{x_min}:{x_max}]\n")
+            else: parts.append("set autoscale x\n")
+            y_min, y_max = y_range['min'].get(), y_range['max'].get()
+            if y_range['mode'].get() == 'manual' and y_min and y_max: parts.append(f"set yrange [{y_min}:{y_max}]\n")
+            else: parts.append("set autoscale y\n")
 
             # Labels and Logscale
-            script += f'set xlabel "Time"\n'
-            script += f'set ylabel "{sub_plot_vars["y_label"].get()}"\n'
-            if sub_plot_vars['y_log'].get(): script += 'set logscale y\n'
-            
+            parts.append(f'set xlabel "Time"\n')
+            parts.append(f'set ylabel "{sub_plot_vars["y_label"].get()}"\n')
+            # One explicit line per subplot; no trailing unset needed since
+            # the next iteration (and the reset session prefix) always
+            # states the logscale it wants.
+            parts.append('set logscale y\n' if sub_plot_vars['y_log'].get() else 'unset logscale y\n')
+
             # Plot clauses
             listbox = sub_plot_vars['listbox']
             selected_indices = listbox.curselection()
             if selected_indices:
                 has_plot = True
+                # One Tcl call for the whole column list instead of one
+                # listbox.get per selected index.
+                all_cols = listbox.get(0, 'end')
                 plot_clauses = []
                 for index in selected_indices:
-                    col_name = listbox.get(index)
+                    col_name = all_cols[index]
                     legend_title = col_name.replace('_', '-')
                     plot_clauses.append(f"'{temp_file}' using \"Time\":\"{col_name}\" with lines title \"{legend_title}\"")
-                script += "plot " + ", ".join(plot_clauses) + "\n"
-            else: 
-                script += "plot [0:1][0:1] -1 with lines notitle\n"
-
-            # Unset settings for next plot
-            if sub_plot_vars['y_log'].get(): script += 'unset logscale y\n'
+                parts.append("plot " + ", ".join(plot_clauses) + "\n")
+            else:
+                parts.append("plot [0:1][0:1] -1 with lines notitle\n")
 
         if not has_plot:
             messagebox.showinfo("Info", "No columns selected for plotting in any sub-plot.")
             return None, None
 
-        script += "\nunset multiplot\nunset grid\nset key on\n"
-        return script, None
+        parts.append("\nunset multiplot\nunset grid\nset key on\n")
+        return "".join(parts), None
+
+    @staticmethod
+    def _snapshot_vars(widgets):
+        """Read every Tk variable in a widgets dict once into a plain dict.
+
+        Each .get() is a Python->Tcl round-trip and the script generators
+        consult dozens of variables per refresh, so they work from this
+        one-shot snapshot instead.
+        """
+        return {k: v.get() for k, v in widgets.items()
+                if isinstance(v, (tk.StringVar, tk.BooleanVar))}
 
     def generate_gnuplot_script(self, widgets, key, terminal_config):
+        s = self._snapshot_vars(widgets)
+
         # Validation checks
-        if not self._validate_positive_integer(widgets['title_font_size'].get(), "Title Font Size") or \
-           not self._validate_positive_integer(widgets['axes_font_size'].get(), "Axes Font Size") or \
-           not self._validate_positive_integer(widgets['legend_font_size'].get(), "Legend Font Size"):
+        if not self._validate_positive_integer(s['title_font_size'], "Title Font Size") or \
+           not self._validate_positive_integer(s['axes_font_size'], "Axes Font Size") or \
+           not self._validate_positive_integer(s['legend_font_size'], "Legend Font Size"):
             return None, None
-        if widgets['x_range_mode'].get() == 'manual':
-            if not self._validate_numeric(widgets['x_min'].get(), "X-Axis Min") or not self._validate_numeric(widgets['x_max'].get(), "X-Axis Max"): return None, None
-        if widgets['y_range_mode'].get() == 'manual':
-            if not self._validate_numeric(widgets['y_min'].get(), "Y1-Axis Min") or not self._validate_numeric(widgets['y_max'].get(), "Y1-Axis Max"): return None, None
-        if widgets['y2_range_mode'].get() == 'manual':
-            if not self._validate_numeric(widgets['y2_min'].get(), "Y2-Axis Min") or not self._validate_numeric(widgets['y2_max'].get(), "Y2-Axis Max"): return None, None
-        if widgets['lock_aspect_ratio'].get():
-            if not self._validate_numeric(widgets['aspect_ratio'].get(), "Aspect Ratio"): return None, None
-        
-        if widgets['use_custom_margins'].get():
-            if not self._validate_positive_integer(widgets['lmargin'].get(), "Left Margin") or \
-               not self._validate_positive_integer(widgets['rmargin'].get(), "Right Margin") or \
-               not self._validate_positive_integer(widgets['tmargin'].get(), "Top Margin") or \
-               not self._validate_positive_integer(widgets['bmargin'].get(), "Bottom Margin"):
+        if s['x_range_mode'] == 'manual':
+            if not self._validate_numeric(s['x_min'], "X-Axis Min") or not self._validate_numeric(s['x_max'], "X-Axis Max"): return None, None
+        if s['y_range_mode'] == 'manual':
+            if not self._validate_numeric(s['y_min'], "Y1-Axis Min") or not self._validate_numeric(s['y_max'], "Y1-Axis Max"): return None, None
+        if s['y2_range_mode'] == 'manual':
+            if not self._validate_numeric(s['y2_min'], "Y2-Axis Min") or not self._validate_numeric(s['y2_max'], "Y2-Axis Max"): return None, None
+        if s['lock_aspect_ratio']:
+            if not self._validate_numeric(s['aspect_ratio'], "Aspect Ratio"): return None, None
+
+        if s['use_custom_margins']:
+            if not self._validate_positive_integer(s['lmargin'], "Left Margin") or \
+               not self._validate_positive_integer(s['rmargin'], "Right Margin") or \
+               not self._validate_positive_integer(s['tmargin'], "Top Margin") or \
+               not self._validate_positive_integer(s['bmargin'], "Bottom Margin"):
                 return None, None
 
-        separator = widgets['separator'].get()
-        detect_headers = widgets['detect_headers'].get()
-        
-        separator_settings = ""
-        key_settings = f"set key font ',{widgets['legend_font_size'].get()}'"
-        use_explicit_titles = True
+        separator = s['separator']
+        detect_headers = s['detect_headers']
+        use_explicit_titles = not (separator == ',' and detect_headers)
+        axes_font = s['axes_font_size']
+
+        # The settings below only change when the user edits a control,
+        # never between auto-replot ticks, so the rendered block is cached
+        # per tab and rebuilt only when one of its input fields changes.
+        static_fields = (separator, detect_headers, s['legend_font_size'],
+                         s['plot_global_title'], s['title_font_size'], axes_font,
+                         s['xlabel'], s['ylabel'],
+                         s['use_custom_margins'], s['lmargin'], s['rmargin'], s['tmargin'], s['bmargin'],
+                         s['lock_aspect_ratio'], s['aspect_ratio'],
+                         s['x_log'], s['y_log'], s['grid_on'], s['grid_style'])
+        cached_fields, static_settings = self.tabs[key].get('script_static', (None, None))
+        if cached_fields != static_fields:
+            separator_settings = ""
+            key_settings = f"set key font ',{s['legend_font_size']}'"
+            if separator == ',':
+                separator_settings = 'set datafile separator ","'
+                if detect_headers:
+                    key_settings += '\nset key autotitle columnheader'
+
+            global_title = s['plot_global_title']
+            title_settings = f'set title "{global_title}" font ",{s["title_font_size"]}"' if global_title else 'unset title'
+
+            if s['use_custom_margins']:
+                margin_parts = [f"set {name}margin {s[name + 'margin']}"
+                                for name in ('l', 'r', 't', 'b')
+                                if s[name + 'margin'] not in ('', '+', '-')]
+                margin_settings = "\n".join(margin_parts) + "\n"
+            else: margin_settings = "unset lmargin; unset rmargin; unset tmargin; unset bmargin\n"
+            aspect_ratio_settings = f"set size ratio {s['aspect_ratio']}" if s['lock_aspect_ratio'] and s['aspect_ratio'] else "set size noratio"
+
+            log_settings = ("set logscale x\n" if s['x_log'] else "unset logscale x\n") + ("set logscale y\n" if s['y_log'] else "unset logscale y\n")
+
+            if s['grid_on']:
+                grid_color = _GRID_COLORS.get(s['grid_style'], 'gray20')
+                grid_settings = f'set grid back linetype 0 linecolor "{grid_color}"'
+            else:
+                grid_settings = 'unset grid'
+
+            static_settings = (
+                f"{separator_settings}\n"
+                f"{key_settings}\n"
+                f"{title_settings}\n"
+                f"{margin_settings}"
+                f"{aspect_ratio_settings}\n"
+                f'set xlabel "{s["xlabel"]}" font ",{axes_font}"\n'
+                f'set ylabel "{s["ylabel"]}" font ",{axes_font}"\n'
+                f'set xtics font ",{axes_font}"\n'
+                f'set ytics font ",{axes_font}"\n'
+                f"{log_settings}"
+                f"{grid_settings}"
+            )
+            self.tabs[key]['script_static'] = (static_fields, static_settings)
 
-        if separator == ',':
-            separator_settings = 'set datafile separator ","'
-            if detect_headers:
-                key_settings += '\nset key autotitle columnheader'
-                use_explicit_titles = False
-        
-        global_title = widgets['plot_global_title'].get()
-        title_font = widgets['title_font_size'].get()
-        title_settings = f'set title "{global_title}" font ",{title_font}"' if global_title else 'unset title'
-        
-        axes_font = widgets['axes_font_size'].get()
-        
         y1_clauses, y2_clauses = [], []
-        data_to_pipe = ""
         cleaned_data_cache = {}
-        visible_datasets = []
 
-        for item_id in widgets['tree'].get_children():
-            if 'checked' in widgets['tree'].item(item_id, 'tags'):
-                visible_datasets.append({
-                    'values': widgets['tree'].item(item_id, 'values'),
-                    'filepath': widgets['tree'].item(item_id, 'tags')[0]
-                })
-        
-        for dataset in visible_datasets:
-            if dataset['values'][6] == 'Yes' and dataset['filepath'] not in cleaned_data_cache:
+        # Single pass over the Treeview: skip unchecked rows, clean each
+        # file the first time it appears, and emit the plot clause — no
+        # intermediate per-row dicts or extra walks over the dataset list.
+        tree = widgets['tree']
+        for item_id in tree.get_children():
+            # One Tcl round-trip per row instead of one per field
+            item = tree.item(item_id)
+            tags = item['tags']
+            if 'checked' not in tags:
+                continue
+            values = item['values']
+            filepath = tags[0]
+            data_block = None
+
+            if values[6] == 'Yes' and filepath not in cleaned_data_cache:
                 try:
-                    with open(dataset['filepath'], 'r') as f:
-                        content = f.read()
-                    cleaned_content = content.replace('(', ' ').replace(')', ' ')
-                    cleaned_data_cache[dataset['filepath']] = cleaned_content
+                    st = os.stat(filepath)
+                    cache = self._clean_cache.pop(filepath, None)
+                    # Reset on truncation or rewrite; otherwise only the
+                    # newly appended tail is read and cleaned.
+                    if cache is None or st.st_size < cache['offset'] or st.st_mtime_ns < cache['mtime_ns']:
+                        cache = {'offset': 0, 'mtime_ns': st.st_mtime_ns, 'buf': ''}
+                    # Re-inserting on every access keeps the dict in LRU
+                    # order, so the bound below evicts the coldest file.
+                    self._clean_cache[filepath] = cache
+                    if len(self._clean_cache) > 64:
+                        del self._clean_cache[next(iter(self._clean_cache))]
+                    if st.st_size > cache['offset']:
+                        with open(filepath, 'rb') as f:
+                            f.seek(cache['offset'])
+                            chunk = f.read()
+                        cache['buf'] += chunk.translate(_CLEAN_TBL).decode(errors='replace')
+                        cache['offset'] += len(chunk)
+                    cache['mtime_ns'] = st.st_mtime_ns
+                    cleaned_data_cache[filepath] = cache['buf']
                 except Exception as e:
-                    messagebox.showerror("File Error", f"Could not read or clean file:\n{dataset['filepath']}\n\nError: {e}")
+                    messagebox.showerror("File Error", f"Could not read or clean file:\n{filepath}\n\nError: {e}")
                     return None, None
 
-        for dataset in visible_datasets:
-            values = dataset['values']
-            filepath = dataset['filepath']
-            
             if values[6] == 'Yes':
+                # Cleaned data goes inline through the '-' special file;
+                # gnuplot reads inline data from the command stream as
+                # ASCII only, so there is no binary variant of this path.
                 plot_source = "'-'"
                 if filepath in cleaned_data_cache:
-                    data_to_pipe += cleaned_data_cache[filepath] + "\ne\n"
+                    data_block = (cleaned_data_cache[filepath] + "\ne\n").encode()
             else:
                 plot_source = f"'{filepath}'"
 
             title_part = f"title '{values[5]}'" if use_explicit_titles else ""
             clause = f"{plot_source} using {values[1]}:{values[2]} with {values[4]} {title_part}"
-            
-            if values[3] == 'Y2': y2_clauses.append(clause + " axes x1y2")
-            else: y1_clauses.append(clause + " axes x1y1")
+
+            # Keep each clause paired with its inline data: gnuplot consumes
+            # the piped blocks in clause order, and Y1 clauses are emitted
+            # before Y2 clauses.
+            if values[3] == 'Y2': y2_clauses.append((clause + " axes x1y2", data_block))
+            else: y1_clauses.append((clause + " axes x1y1", data_block))
 
         if not y1_clauses and not y2_clauses: return None, None
-        full_plot_command = "plot " + ", ".join(y1_clauses + y2_clauses)
-        y2_settings = ""
+        all_clauses = y1_clauses + y2_clauses
+        full_plot_command = "plot " + ", ".join(clause for clause, _ in all_clauses)
+        data_to_pipe_parts = [block for _, block in all_clauses if block]
         if y2_clauses:
-            y2_settings += "set ytics nomirror\nset y2tics\n"
-            y2_settings += f'set y2label "{widgets["y2label"].get()}" font ",{axes_font}"\n'
-            y2_settings += f'set y2tics font ",{axes_font}"\n'
-            y2_settings += ("set logscale y2\n" if widgets['y2_log'].get() else "unset logscale y2\n")
-            if widgets['y2_range_mode'].get() == 'manual' and widgets['y2_min'].get() and widgets['y2_max'].get(): y2_settings += f"set y2range [{widgets['y2_min'].get()}:{widgets['y2_max'].get()}]\n"
-            else: y2_settings += "set autoscale y2\n"
+            y2_parts = ["set ytics nomirror\nset y2tics",
+                        f'set y2label "{s["y2label"]}" font ",{axes_font}"',
+                        f'set y2tics font ",{axes_font}"',
+                        "set logscale y2" if s['y2_log'] else "unset logscale y2"]
+            if s['y2_range_mode'] == 'manual' and s['y2_min'] and s['y2_max']: y2_parts.append(f"set y2range [{s['y2_min']}:{s['y2_max']}]")
+            else: y2_parts.append("set autoscale y2")
+            y2_settings = "\n".join(y2_parts) + "\n"
         else: y2_settings = "unset y2tics\nunset y2label\n"
-        
-        if widgets['grid_on'].get():
-            color_map = {'Light': 'gray40', 'Medium': 'gray20', 'Dark': 'gray0'}
-            grid_color = color_map.get(widgets['grid_style'].get(), 'gray20')
-            grid_settings = f'set grid back linetype 0 linecolor "{grid_color}"'
-        else:
-            grid_settings = 'unset grid'
-
-        log_settings = ("set logscale x\n" if widgets['x_log'].get() else "unset logscale x\n") + ("set logscale y\n" if widgets['y_log'].get() else "unset logscale y\n")
-        range_settings = ""
-        if widgets['x_range_mode'].get() == 'manual' and widgets['x_min'].get() and widgets['x_max'].get(): range_settings += f"set xrange [{widgets['x_min'].get()}:{widgets['x_max'].get()}]\n"
-        else: range_settings += "set autoscale x\n"
-        if widgets['y_range_mode'].get() == 'manual' and widgets['y_min'].get() and widgets['y_max'].get(): range_settings += f"set yrange [{widgets['y_min'].get()}:{widgets['y_max'].get()}]\n"
-        else: range_settings += "set autoscale y\n"
-        margin_settings = ""
-        if widgets['use_custom_margins'].get():
-            if widgets['lmargin'].get() not in ('', '+', '-'): margin_settings += f"set lmargin {widgets['lmargin'].get()}\n"
-            if widgets['rmargin'].get() not in ('', '+', '-'): margin_settings += f"set rmargin {widgets['rmargin'].get()}\n"
-            if widgets['tmargin'].get() not in ('', '+', '-'): margin_settings += f"set tmargin {widgets['tmargin'].get()}\n"
-            if widgets['bmargin'].get() not in ('', '+', '-'): margin_settings += f"set bmargin {widgets['bmargin'].get()}\n"
-        else: margin_settings = "unset lmargin; unset rmargin; unset tmargin; unset bmargin\n"
-        aspect_ratio_settings = f"set size ratio {widgets['aspect_ratio'].get()}" if widgets['lock_aspect_ratio'].get() and widgets['aspect_ratio'].get() else "set size noratio"
 
+        range_parts = []
+        if s['x_range_mode'] == 'manual' and s['x_min'] and s['x_max']: range_parts.append(f"set xrange [{s['x_min']}:{s['x_max']}]")
+        else: range_parts.append("set autoscale x")
+        if s['y_range_mode'] == 'manual' and s['y_min'] and s['y_max']: range_parts.append(f"set yrange [{s['y_min']}:{s['y_max']}]")
+        else: range_parts.append("set autoscale y")
+        range_settings = "\n".join(range_parts) + "\n"
+
+        output_settings = f"set output '{terminal_config['output']}'" if terminal_config.get('output') else "unset output"
         script = f"""
             set terminal {terminal_config['term']} size {terminal_config['size']} enhanced font 'Verdana,10'
-            set output '{terminal_config['output']}'
-            {separator_settings}
-            {key_settings}
-            {title_settings}
-            {margin_settings}
-            {aspect_ratio_settings}
-            set xlabel "{widgets['xlabel'].get()}" font ",{axes_font}"
-            set ylabel "{widgets['ylabel'].get()}" font ",{axes_font}"
-            set xtics font ",{axes_font}"
-            set ytics font ",{axes_font}"
-            {log_settings}
-            {grid_settings}
+            {output_settings}
+            {static_settings}
             {range_settings}
             {y2_settings}
             {full_plot_command}
-            set datafile separator whitespace
-            unset key
-            unset output
         """
-        return script, data_to_pipe
+        return script, b"".join(data_to_pipe_parts)
+
+    _GNUPLOT_SENTINEL = b"__GNUPLOT_DONE__\n"
+
+    def _get_gnuplot_proc(self, tab_data):
+        """Return the tab's persistent gnuplot process, spawning it if needed."""
+        proc = tab_data.get('gnuplot_proc')
+        if proc is None or proc.poll() is not None:
+            proc = subprocess.Popen(
+                ['gnuplot'],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+            tab_data['gnuplot_proc'] = proc
+            # Bounded ring: a script that warns per datapoint cannot grow
+            # the buffer without limit, and the messagebox only ever shows
+            # the tail anyway.
+            tab_data['gnuplot_stderr'] = stderr_lines = deque(maxlen=200)
+            # Drain stderr continuously so gnuplot can never block on a
+            # full pipe; collected lines are used for error reporting.
+            threading.Thread(
+                target=self._stderr_drain_worker, args=(proc.stderr, stderr_lines),
+                daemon=True
+            ).start()
+        return proc
+
+    @staticmethod
+    def _stderr_drain_worker(stream, sink):
+        try:
+            for line in stream:
+                sink.append(line.decode(errors='replace'))
+        except (ValueError, OSError):
+            pass
+
+    def _run_gnuplot(self, key, full_input):
+        """Stream a script into the tab's persistent gnuplot process.
+
+        Any image the script emits on stdout (no `set output` file) is
+        captured in memory; a sentinel printed after `unset output` marks
+        the end of the run. Returns (stdout_bytes, error_string) where
+        error_string is "" on success.
+
+        Serialized per tab: save/copy run on the Tk thread against the
+        same process the plot worker uses, and interleaved writes or
+        competing stdout reads would mix the two runs' output.
+        """
+        # The tab can be closed on the Tk thread between a worker's
+        # in-tabs check and this call; bail out instead of raising.
+        tab_data = self.tabs.get(key)
+        if tab_data is None:
+            return b"", "Tab was closed before the plot could run."
+        with tab_data['gnuplot_lock']:
+            proc = self._get_gnuplot_proc(tab_data)
+            stderr_lines = tab_data['gnuplot_stderr']
+            stderr_lines.clear()
+            output = bytearray()
+            try:
+                script = full_input if isinstance(full_input, bytes) else full_input.encode()
+                script += b'\nunset output\nset print "-"\nprint "__GNUPLOT_DONE__"\n'
+                proc.stdin.write(script)
+                proc.stdin.flush()
+                while not output.endswith(self._GNUPLOT_SENTINEL):
+                    chunk = proc.stdout.read1(65536)
+                    if not chunk: # EOF: gnuplot aborted on a script error
+                        break
+                    output += chunk
+            except (BrokenPipeError, OSError) as e:
+                stderr_lines.append(str(e))
+
+            if proc.poll() is not None:
+                # A script error aborts gnuplot in batch mode; the next call
+                # to _get_gnuplot_proc will respawn it.
+                tab_data['gnuplot_proc'] = None
+                time.sleep(0.05) # Let the drain thread collect the last lines
+                return bytes(output), "".join(stderr_lines) or "The gnuplot process terminated unexpectedly."
+
+            return bytes(output[:-len(self._GNUPLOT_SENTINEL)]), ""
+
+    def _shutdown_gnuplot(self, key):
+        tab_data = self.tabs.get(key)
+        if not tab_data:
+            return
+        proc = tab_data.get('gnuplot_proc')
+        if proc and proc.poll() is None:
+            try:
+                proc.stdin.close()
+                proc.terminate()
+            except OSError:
+                pass
+        tab_data['gnuplot_proc'] = None
+
+    @staticmethod
+    def _assemble_gnuplot_input(gnuplot_script, data_to_pipe):
+        """Combine a script and its inline data into one byte stream.
+
+        Inline data (ASCII or binary) must begin immediately after the
+        newline ending the plot command, so the script is stripped of
+        trailing whitespace first. A leading `reset session` wipes any
+        state the previous run left in the persistent process.
+        """
+        payload = b"reset session\n" + gnuplot_script.rstrip().encode() + b"\n"
+        if data_to_pipe:
+            if isinstance(data_to_pipe, str):
+                data_to_pipe = data_to_pipe.encode()
+            payload += data_to_pipe
+        return payload
+
+    @staticmethod
+    def _has_visible_datasets(widgets):
+        """True if any dataset row in the tree is checked."""
+        tree = widgets['tree']
+        return any('checked' in tree.item(item_id, 'tags') for item_id in tree.get_children())
 
     def refresh_and_plot(self, widgets, key):
         """Used by the manual refresh button in logfile mode."""
         self._execute_incremental_parse(key)
         self.plot(widgets, key)
 
+    def _data_file_signature(self, widgets, key):
+        """Stat signature of the files gnuplot will read from disk for this tab."""
+        if widgets['mode'].get() == "Normal":
+            filepaths = set()
+            for item_id in widgets['tree'].get_children():
+                tags = widgets['tree'].item(item_id, 'tags')
+                if 'checked' in tags:
+                    filepaths.add(tags[0])
+        else:
+            temp_file = self.tabs[key].get('temp_file_path')
+            filepaths = {temp_file} if temp_file else set()
+
+        signature = []
+        for filepath in sorted(filepaths):
+            try:
+                st = os.stat(filepath)
+                signature.append((filepath, st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append((filepath, None, None))
+        return tuple(signature)
+
     def plot(self, widgets, key):
-        width, height = self.tabs[key]['plot_width'], self.tabs[key]['plot_height']
-        image_filename = f"plot_{key}.png"
-        terminal_config = {'term': 'pngcairo', 'size': f'{width},{height}', 'output': image_filename}
-        
+        tab_data = self.tabs[key]
+        # No output file: the PNG is streamed back over gnuplot's stdout.
+        # The config dict only depends on the plot size, so rebuild it only
+        # when a resize actually changed the size.
+        size = (tab_data['plot_width'], tab_data['plot_height'])
+        if tab_data.get('terminal_size') != size:
+            tab_data['terminal_size'] = size
+            tab_data['terminal_config'] = {'term': 'pngcairo', 'size': f'{size[0]},{size[1]}', 'output': None}
+        terminal_config = tab_data['terminal_config']
+
         mode = widgets['mode'].get()
+        # Nothing checked: skip script generation and data loading outright
+        # (auto-replot keeps ticking while everything is unchecked).
+        if mode == "Normal" and not self._has_visible_datasets(widgets):
+            return
         gnuplot_script, data_to_pipe = None, None
 
         if mode == "Normal":
             gnuplot_script, data_to_pipe = self.generate_gnuplot_script(widgets, key, terminal_config)
         else: # Plot Logfile
             gnuplot_script, data_to_pipe = self.generate_logfile_plot_script(widgets, key, terminal_config)
-        
-        if not gnuplot_script: 
+
+        if not gnuplot_script:
             return
-        
-        full_input = gnuplot_script
-        if data_to_pipe:
-            full_input += "\n" + data_to_pipe
 
-        completed_process = subprocess.run(['gnuplot'], input=full_input, text=True, capture_output=True)
+        full_input = self._assemble_gnuplot_input(gnuplot_script, data_to_pipe)
+
+        # Skip the gnuplot run entirely when neither the script nor the
+        # underlying data files changed since the last successful plot.
+        plot_sig = (full_input, self._data_file_signature(widgets, key))
+        if plot_sig == self.tabs[key].get('last_plot_sig'):
+            return
+
+        self._enqueue_plot_job(key, (full_input, plot_sig))
+
+    def _enqueue_plot_job(self, key, job):
+        """Hand a job to the tab's plot worker, replacing any stale pending one."""
+        q = self.tabs[key]['plot_queue']
+        while True:
+            try:
+                q.put_nowait(job)
+                return
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
 
-        if completed_process.returncode != 0: 
-            messagebox.showerror("Gnuplot Error", completed_process.stderr)
+    def _plot_worker(self, key):
+        """Background loop: runs queued gnuplot jobs and posts results to Tk."""
+        q = self.tabs[key]['plot_queue']
+        while True:
+            job = q.get()
+            if job is None or key not in self.tabs:
+                return
+            full_input, plot_sig = job
+            png_bytes, error_output = self._run_gnuplot(key, full_input)
+            if key not in self.tabs:
+                return
+            self.root.after(0, self._install_plot_result, key, png_bytes, error_output, plot_sig)
+
+    def _install_plot_result(self, key, png_bytes, error_output, plot_sig):
+        if key not in self.tabs:
+            return
+        widgets = self.tabs[key]['widgets']
+        if error_output:
+            messagebox.showerror("Gnuplot Error", error_output)
             return
         try:
-            img = Image.open(image_filename); photo = ImageTk.PhotoImage(img)
-            plot_label = widgets['plot_label']; plot_label.config(text="", image=photo); plot_label.image = photo
+            # Tk 8.6 decodes PNG natively, so the bytes go straight into the
+            # photo with no PIL round trip. Reconfiguring the existing image
+            # keeps the same Tcl image installed in the label.
+            photo = self.tabs[key].get('photo')
+            if photo is not None:
+                photo.configure(data=png_bytes)
+            else:
+                photo = tk.PhotoImage(data=png_bytes)
+                self.tabs[key]['photo'] = photo
+                plot_label = widgets['plot_label']; plot_label.config(text="", image=photo); plot_label.image = photo
+            self.tabs[key]['last_plot_sig'] = plot_sig
         except Exception as e: messagebox.showerror("Image Error", f"An error occurred while loading the plot image:\n{e}")
 
     def save_plot(self, widgets, key):
         filepath = filedialog.asksaveasfilename(title="Save Plot As...", filetypes=(("PNG Image", "*.png"), ("SVG Vector Image", "*.svg"), ("PDF Document", "*.pdf"), ("Encapsulated PostScript", "*.eps")), defaultextension=".png")
         if not filepath: return
         _, extension = os.path.splitext(filepath)
-        term_map = {'.png': 'pngcairo', '.svg': 'svg', '.pdf': 'pdfcairo', '.eps': 'postscript eps enhanced color'}
-        if extension not in term_map: messagebox.showerror("Unsupported Format", f"File format '{extension}' is not supported."); return
-        terminal_config = {'term': term_map[extension], 'size': '1024,768', 'output': filepath}
+        if extension not in _TERM_MAP: messagebox.showerror("Unsupported Format", f"File format '{extension}' is not supported."); return
+        terminal_config = {'term': _TERM_MAP[extension], 'size': '1024,768', 'output': filepath}
 
         mode = widgets['mode'].get()
+        if mode == "Normal" and not self._has_visible_datasets(widgets):
+            messagebox.showwarning("Plotting Canceled", "Plotting was canceled due to no visible data or an invalid setting.")
+            return
         gnuplot_script, data_to_pipe = None, None
 
         if mode == "Normal":
@@ -1325,21 +1892,22 @@ class GnuplotApp:
         if not gnuplot_script: 
             messagebox.showwarning("Plotting Canceled", "Plotting was canceled due to no visible data or an invalid setting.")
             return
-            
-        full_input = gnuplot_script
-        if data_to_pipe:
-            full_input += "\n" + data_to_pipe
 
-        completed_process = subprocess.run(['gnuplot'], input=full_input, text=True, capture_output=True)
-        if completed_process.returncode != 0: messagebox.showerror("Gnuplot Error", completed_process.stderr)
+        full_input = self._assemble_gnuplot_input(gnuplot_script, data_to_pipe)
+
+        _, error_output = self._run_gnuplot(key, full_input)
+        if error_output: messagebox.showerror("Gnuplot Error", error_output)
         else: messagebox.showinfo("Success", f"Plot saved successfully to:\n{filepath}")
         
     def copy_plot_to_clipboard(self, widgets, key):
-        image_filename = os.path.abspath(f"plot_{key}_cropped.png") 
         width, height = self.tabs[key]['plot_width'], self.tabs[key]['plot_height']
-        terminal_config = {'term': 'pngcairo crop', 'size': f'{width},{height}', 'output': image_filename}
+        # No output file: the cropped PNG comes back over gnuplot's stdout
+        terminal_config = {'term': 'pngcairo crop', 'size': f'{width},{height}', 'output': None}
         
         mode = widgets['mode'].get()
+        if mode == "Normal" and not self._has_visible_datasets(widgets):
+            messagebox.showwarning("Plotting Canceled", "Plotting was canceled due to no visible data or an invalid setting.")
+            return
         gnuplot_script, data_to_pipe = None, None
         
         if mode == "Normal":
@@ -1350,62 +1918,143 @@ class GnuplotApp:
         if not gnuplot_script: 
             messagebox.showwarning("Plotting Canceled", "Plotting was canceled due to no visible data or an invalid setting.")
             return
-        
-        full_input = gnuplot_script
-        if data_to_pipe:
-            full_input += "\n" + data_to_pipe
 
-        completed_process = subprocess.run(['gnuplot'], input=full_input, text=True, capture_output=True)
-        if completed_process.returncode != 0: messagebox.showerror("Gnuplot Error", completed_process.stderr); return
-        if not os.path.exists(image_filename): messagebox.showerror("Error", "Cropped plot image not found."); return
-        system = platform.system()
+        full_input = self._assemble_gnuplot_input(gnuplot_script, data_to_pipe)
+
+        png_bytes, error_output = self._run_gnuplot(key, full_input)
+        if error_output: messagebox.showerror("Gnuplot Error", error_output); return
+        if not png_bytes: messagebox.showerror("Error", "Cropped plot image could not be generated."); return
         try:
-            if system == "Windows": command = f'powershell -command "Add-Type -AssemblyName System.Windows.Forms; [System.Windows.Forms.Clipboard]::SetImage([System.Drawing.Image]::FromFile(\'{image_filename}\'))"'; subprocess.run(command, check=True, shell=True)
-            elif system == "Darwin": command = f"""osascript -e 'set the clipboard to (read (POSIX file "{image_filename}") as TIFF picture)'"""; subprocess.run(command, check=True, shell=True)
-            elif system == "Linux": subprocess.run(['xclip', '-selection', 'clipboard', '-t', 'image/png', '-i', image_filename], check=True)
-            else: messagebox.showwarning("Unsupported OS", f"Copy to clipboard is not supported on '{system}'."); return
+            if not self._clipboard_send(png_bytes, key):
+                return
             messagebox.showinfo("Success", "Cropped plot image copied to clipboard.")
         except (FileNotFoundError, subprocess.CalledProcessError) as e:
             error_msg = str(e)
             if "xclip" in error_msg: messagebox.showerror("Dependency Missing", "To copy on Linux, 'xclip' must be installed.\nPlease run: sudo apt-get install xclip")
             else: messagebox.showerror("Clipboard Error", f"Failed to copy image to clipboard.\n{error_msg}")
+
+    @staticmethod
+    def _clipboard_png_path(key):
+        """Temp-file path for clipboard tools that only accept a filename.
+
+        Lives in the system temp dir (tmpfs on most Linux setups) rather
+        than the CWD, which may be a slow network mount; the name is
+        stable per tab so the same inode is rewritten each copy.
+        """
+        return os.path.join(gettempdir(), f"gnuplot_gui_plot_{key}_cropped.png")
+
+    def _clipboard_send_linux(self, png_bytes, key):
+        # xclip reads the image from stdin, so no temp file is needed.
+        subprocess.run(['xclip', '-selection', 'clipboard', '-t', 'image/png', '-i'], input=png_bytes, check=True)
+        return True
+
+    def _clipboard_send_windows(self, png_bytes, key):
+        image_filename = self._clipboard_png_path(key)
+        with open(image_filename, 'wb') as f:
+            f.write(png_bytes)
+        # Tokenized argv: no cmd.exe hop and no quoting of the file path.
+        ps_script = f"Add-Type -AssemblyName System.Windows.Forms; [System.Windows.Forms.Clipboard]::SetImage([System.Drawing.Image]::FromFile('{image_filename}'))"
+        subprocess.run(['powershell', '-NoProfile', '-Command', ps_script], check=True)
+        return True
+
+    def _clipboard_send_darwin(self, png_bytes, key):
+        image_filename = self._clipboard_png_path(key)
+        with open(image_filename, 'wb') as f:
+            f.write(png_bytes)
+        # Tokenized argv: osascript gets the expression directly, no shell.
+        script = f'set the clipboard to (read (POSIX file "{image_filename}") as TIFF picture)'
+        subprocess.run(['osascript', '-e', script], check=True)
+        return True
+
+    def _clipboard_send_unsupported(self, png_bytes, key):
+        messagebox.showwarning("Unsupported OS", f"Copy to clipboard is not supported on '{platform.system()}'.")
+        return False
     
     def on_plot_resize(self, event, key):
         if key not in self.tabs: return
         tab_data = self.tabs[key]
+        new_width = max(event.width - 20, 100); new_height = max(event.height - 20, 100)
+        # <Configure> also fires for moves and repeats; only a real size
+        # change warrants a replot.
+        if (new_width, new_height) == (tab_data['plot_width'], tab_data['plot_height']):
+            return
         if tab_data['resize_job']: self.root.after_cancel(tab_data['resize_job'])
-        tab_data['plot_width'] = max(event.width - 20, 100); tab_data['plot_height'] = max(event.height - 20, 100)
-        tab_data['resize_job'] = self.root.after(250, lambda: self.plot(tab_data['widgets'], key))
+        tab_data['plot_width'] = new_width; tab_data['plot_height'] = new_height
+        tab_data['resize_job'] = self.root.after(150, lambda: self._on_resize_settled(key))
+
+    def _on_resize_settled(self, key):
+        if key not in self.tabs: return
+        tab_data = self.tabs[key]
+        tab_data['resize_job'] = None
+        # A settled size within 3% of the last rendered one is not worth a
+        # full gnuplot re-render; the slight letterboxing is invisible.
+        new_size = (tab_data['plot_width'], tab_data['plot_height'])
+        last = tab_data.get('last_rendered_size')
+        if last and abs(new_size[0] - last[0]) < 0.03 * last[0] \
+                and abs(new_size[1] - last[1]) < 0.03 * last[1]:
+            return
+        tab_data['last_rendered_size'] = new_size
+        # after_idle defers the render until the event queue has drained,
+        # so a resize storm that outlasts the debounce still renders once.
+        self.root.after_idle(self.plot, tab_data['widgets'], key)
 
     def browse_file(self, widgets):
         filename = filedialog.askopenfilename(title="Select a data file"); 
         if filename: widgets['filepath'].set(filename); widgets['plot_title'].set(os.path.basename(filename))
         
-    def _get_column_header(self, filepath, y_col_index):
+    def _header_fields(self, filepath):
+        """Fields of the '# Time ...' header line, or None if absent.
+
+        Results are cached per file and reused until the file's mtime
+        changes, so dataset edits and auto-replot updates that look up
+        the same header repeatedly cost one os.stat each.
+        """
         try:
-            with open(filepath, 'r') as f:
-                for line in f:
-                    stripped_line = line.strip()
-                    if stripped_line.startswith("# Time"):
-                        headers = stripped_line.lstrip('#').split()
-                        if 0 < y_col_index <= len(headers):
-                            return headers[y_col_index - 1]
-                        else:
-                            return None
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        cached = self._header_cache.get(filepath)
+        if cached and cached[0] == st.st_mtime_ns:
+            return cached[1]
+        fields = self._scan_header_fields(filepath, st.st_size)
+        self._header_cache[filepath] = (st.st_mtime_ns, fields)
+        return fields
+
+    @staticmethod
+    def _scan_header_fields(filepath, size):
+        """One-pass header scan: mmap the first 64 KiB and regex-search it.
+
+        The header sits near the top of the file, so only a file whose
+        header is somehow not in that window falls back to scanning the
+        whole file.
+        """
+        try:
+            if size == 0:
+                return None
+            with open(filepath, 'rb') as f:
+                with mmap.mmap(f.fileno(), min(65536, size), access=mmap.ACCESS_READ) as mm:
+                    match = _HEADER_LINE_RE.search(mm)
+                    # Copy out before the map closes; the match only holds
+                    # a view into the mapped buffer.
+                    line = match.group(0) if match else None
+                if line is None and size > 65536:
+                    match = _HEADER_LINE_RE.search(f.read())
+                    line = match.group(0) if match else None
+            if line is None:
+                return None
+            return line.decode().strip().lstrip('#').split()
         except Exception:
             return None
+
+    def _get_column_header(self, filepath, y_col_index):
+        headers = self._header_fields(filepath)
+        if headers and 0 < y_col_index <= len(headers):
+            return headers[y_col_index - 1]
         return None
 
     def _get_column_count(self, filepath):
-        try:
-            with open(filepath, 'r') as f:
-                for line in f:
-                    stripped_line = line.strip()
-                    if stripped_line.startswith("# Time"):
-                        return len(stripped_line.lstrip('#').split())
-        except Exception:
-            return 0
-        return 0
+        headers = self._header_fields(filepath)
+        return len(headers) if headers else 0
 
     def add_dataset(self, widgets, key):
         filepath = widgets['filepath'].get()
@@ -1426,7 +2075,7 @@ class GnuplotApp:
         clean_state = 'Yes' if widgets['clean_data'].get() else 'No'
         values = (os.path.basename(filepath), widgets['x_col'].get(), widgets['y_col'].get(), widgets['y_axis_select'].get(), widgets['plot_style'].get(), plot_title_to_set, clean_state)
         widgets['tree'].insert('', 'end', values=values, tags=(filepath, 'checked'), text="☑")
-        self.plot(widgets, key)
+        self._schedule_plot(widgets, key)
 
     def duplicate_dataset(self, widgets, key):
         selected_item = self._get_selected_or_focused_item(widgets['tree'])
@@ -1461,7 +2110,7 @@ class GnuplotApp:
                 new_tags += ('load_all_group',)
 
             widgets['tree'].insert('', 'end', values=tuple(values), tags=new_tags, text="☑")
-            self.plot(widgets, key)
+            self._schedule_plot(widgets, key)
 
         except ValueError:
             messagebox.showerror("Error", f"Could not increment Y-column '{values[2]}'.")
@@ -1491,24 +2140,29 @@ class GnuplotApp:
         
         widgets['tree'].item(selected_item, tags=(full_path, 'checked', 'load_all_group'))
 
+        # Loop-invariant reads hoisted: widget state, the cached header
+        # fields, and the insert bound method.
+        use_headers = widgets['detect_headers'].get() and widgets['separator'].get() == 'whitespace'
+        headers = self._header_fields(full_path) if use_headers else None
+        base_title = values[5].split(' (col')[0]
+        tags = (full_path, 'checked', 'load_all_group')
+        insert = widgets['tree'].insert
+
         for new_y_col in range(start_y_col + 1, total_cols + 1):
             new_values = list(values)
             new_values[2] = str(new_y_col)
 
             plot_title_to_set = ""
-            if widgets['detect_headers'].get() and widgets['separator'].get() == 'whitespace':
-                header_title = self._get_column_header(full_path, new_y_col)
-                if header_title:
-                    plot_title_to_set = header_title
-            
+            if headers and 0 < new_y_col <= len(headers):
+                plot_title_to_set = headers[new_y_col - 1]
+
             if not plot_title_to_set:
-                base_title = new_values[5].split(' (col')[0]
                 plot_title_to_set = f"{base_title} (col {new_y_col})"
-            
+
             new_values[5] = plot_title_to_set
-            widgets['tree'].insert('', 'end', values=tuple(new_values), tags=(full_path, 'checked', 'load_all_group'), text="☑")
+            insert('', 'end', values=tuple(new_values), tags=tags, text="☑")
 
-        self.plot(widgets, key)
+        self._schedule_plot(widgets, key)
         
     def update_dataset(self, widgets, key):
         selected_item = self._get_selected_or_focused_item(widgets['tree'])
@@ -1546,14 +2200,14 @@ class GnuplotApp:
 
         widgets['tree'].item(selected_item, values=values, tags=tags_to_set)
         widgets['update_button'].config(state='disabled'); widgets['duplicate_button'].config(state='disabled'); widgets['load_all_button'].config(state='disabled'); widgets['remove_button'].config(state='disabled')
-        self.plot(widgets, key)
+        self._schedule_plot(widgets, key)
 
     def remove_dataset(self, widgets, key):
         selected_item = self._get_selected_or_focused_item(widgets['tree'])
         if selected_item: 
             widgets['tree'].delete(selected_item)
             widgets['update_button'].config(state='disabled'); widgets['duplicate_button'].config(state='disabled'); widgets['load_all_button'].config(state='disabled'); widgets['remove_button'].config(state='disabled')
-            self.plot(widgets, key)
+            self._schedule_plot(widgets, key)
 
     def on_tree_select(self, event, widgets):
         selected_items = widgets['tree'].selection()
@@ -1564,8 +2218,9 @@ class GnuplotApp:
         widgets['update_button'].config(state='normal'); widgets['duplicate_button'].config(state='normal'); widgets['remove_button'].config(state='normal')
         
         selected_item = selected_items[0]
-        values = widgets['tree'].item(selected_item, "values"); full_path = widgets['tree'].item(selected_item, "tags")[0]
-        tags = widgets['tree'].item(selected_item, "tags")
+        # One Tcl round-trip per row instead of one per field
+        item = widgets['tree'].item(selected_item)
+        values = item['values']; tags = item['tags']; full_path = tags[0]
 
         widgets['filepath'].set(full_path); widgets['x_col'].set(values[1]); widgets['y_col'].set(values[2]); widgets['y_axis_select'].set(values[3]); widgets['plot_style'].set(values[4]); widgets['plot_title'].set(values[5])
         
@@ -1594,13 +2249,15 @@ class GnuplotApp:
             start_button = widgets['logfile_start_button']
             stop_button = widgets['logfile_stop_button']
 
-        self.stop_replot(widgets)
-        self.auto_replotting = True
+        self.stop_replot(widgets, key)
+        tab_data = self.tabs[key]
+        tab_data['auto_replotting'] = True
+        tab_data['replot_next_t'] = time.monotonic()
         start_button.config(state="disabled")
         stop_button.config(state="normal")
         self.auto_replot_loop(widgets, key)
 
-    def stop_replot(self, widgets):
+    def stop_replot(self, widgets, key):
         mode = widgets['mode'].get()
         if mode == 'Normal':
             start_button = widgets['start_button']
@@ -1609,39 +2266,54 @@ class GnuplotApp:
             start_button = widgets['logfile_start_button']
             stop_button = widgets['logfile_stop_button']
 
-        self.auto_replotting = False
-        if self.active_auto_replot_job: 
-            self.root.after_cancel(self.active_auto_replot_job)
-            self.active_auto_replot_job = None
-        
+        tab_data = self.tabs.get(key)
+        if tab_data:
+            tab_data['auto_replotting'] = False
+            if tab_data['replot_job']:
+                self.root.after_cancel(tab_data['replot_job'])
+                tab_data['replot_job'] = None
+
         start_button.config(state="normal")
         stop_button.config(state="disabled")
 
     def auto_replot_loop(self, widgets, key):
-        if self.auto_replotting:
+        # Auto-replot state lives on the tab, so several tabs can refresh
+        # concurrently; each feeds its own plot worker and gnuplot process.
+        tab_data = self.tabs.get(key)
+        if tab_data and tab_data['auto_replotting']:
             mode = widgets['mode'].get()
-            
+
             # If in logfile mode, incrementally parse before plotting
             if mode == "Plot Logfile":
                 if not self._execute_incremental_parse(key):
                     # Stop replotting if silent parse fails (e.g., file deleted)
-                    self.stop_replot(widgets)
+                    self.stop_replot(widgets, key)
                     return
-            
+
             self.plot(widgets, key)
-            
-            try: 
+
+            try:
                 interval_var = widgets['replot_interval'] if mode == 'Normal' else widgets['logfile_replot_interval']
                 interval = int(interval_var.get())
 
                 if interval <= 0:
                     messagebox.showwarning("Invalid Interval", "Auto-replot interval must be a positive number.")
-                    self.stop_replot(widgets)
+                    self.stop_replot(widgets, key)
                     return
-                self.active_auto_replot_job = self.root.after(interval, lambda: self.auto_replot_loop(widgets, key))
-            except ValueError: 
+                # Drift-corrected scheduling: aim for the next deadline on
+                # the monotonic clock rather than adding the interval to
+                # whenever this tick happened to finish.
+                tab_data['replot_next_t'] += interval / 1000.0
+                delay_ms = int((tab_data['replot_next_t'] - time.monotonic()) * 1000)
+                if delay_ms <= 0:
+                    # Fell behind (slow gnuplot run); rebase instead of
+                    # firing a catch-up burst.
+                    tab_data['replot_next_t'] = time.monotonic()
+                    delay_ms = 1
+                tab_data['replot_job'] = self.root.after(delay_ms, lambda: self.auto_replot_loop(widgets, key))
+            except ValueError:
                 messagebox.showwarning("Invalid Interval", "Please enter a valid whole number for the auto-replot interval (in ms).")
-                self.stop_replot(widgets)
+                self.stop_replot(widgets, key)
 
     def save_session(self):
         filepath = filedialog.asksaveasfilename(
@@ -1652,21 +2324,25 @@ class GnuplotApp:
             return False
 
         session_data = {'tabs': []}
-        
-        for tab_id in self.notebook.tabs():
-            if self.notebook.tab(tab_id, "text") == '+':
+
+        # One reverse index instead of scanning self.tabs per notebook tab.
+        frame_to_key = {v['frame_path']: k for k, v in self.tabs.items()}
+
+        # Snapshot tab ids and titles once; each .tab() call is a Tcl
+        # round-trip and the title is needed twice per tab below.
+        tab_texts = {tid: self.notebook.tab(tid, 'text') for tid in self.notebook.tabs()}
+
+        for tab_id, tab_text in tab_texts.items():
+            if tab_text == '+':
                 continue
-            
-            key_found = None
-            for k, v in self.tabs.items():
-                if str(v['frame']) == str(tab_id):
-                    key_found = k
-                    break
+
+            key_found = frame_to_key.get(str(tab_id))
             if not key_found:
                 continue
             
             tab_info = self.tabs[key_found]
             widgets = tab_info['widgets']
+            self._ensure_logfile_widgets(widgets, key_found)
             paned_window = tab_info['paned_window']
             
             plot_sash_pos = 0
@@ -1675,22 +2351,32 @@ class GnuplotApp:
             except (tk.TclError, KeyError): # Handle case where sash might not exist
                 plot_sash_pos = int(paned_window.winfo_height() * 0.8)
 
+            # One walk over the subplot vars builds all six lists.
+            y_labels, y_logs, legends, x_ranges, y_ranges, selections = [], [], [], [], [], []
+            for v in widgets['subplot_vars']:
+                y_labels.append(v['y_label'].get())
+                y_logs.append(v['y_log'].get())
+                legends.append(v['show_legend'].get())
+                xr = v['x_range']; x_ranges.append({'mode': xr['mode'].get(), 'min': xr['min'].get(), 'max': xr['max'].get()})
+                yr = v['y_range']; y_ranges.append({'mode': yr['mode'].get(), 'min': yr['min'].get(), 'max': yr['max'].get()})
+                selections.append(v['listbox'].curselection())
+
             tab_data = {
-                'tab_title': self.notebook.tab(tab_id, 'text'), 
+                'tab_title': tab_text,
                 'sash_position': paned_window.sashpos(0),
                 'plot_sash_position': plot_sash_pos,
                 'mode': widgets['mode'].get(),
-                'settings': {}, 
+                'settings': {},
                 'datasets': [],
                 'logfile_settings': {
                     'path': widgets['logfile_path'].get(),
                     'monitored_columns': tab_info.get('monitored_columns'),
-                    'subplot_y_labels': [v['y_label'].get() for v in widgets['subplot_vars']],
-                    'subplot_y_logs': [v['y_log'].get() for v in widgets['subplot_vars']],
-                    'subplot_show_legends': [v['show_legend'].get() for v in widgets['subplot_vars']],
-                    'subplot_x_ranges': [{'mode': v['x_range']['mode'].get(), 'min': v['x_range']['min'].get(), 'max': v['x_range']['max'].get()} for v in widgets['subplot_vars']],
-                    'subplot_y_ranges': [{'mode': v['y_range']['mode'].get(), 'min': v['y_range']['min'].get(), 'max': v['y_range']['max'].get()} for v in widgets['subplot_vars']],
-                    'subplot_selections': [v['listbox'].curselection() for v in widgets['subplot_vars']],
+                    'subplot_y_labels': y_labels,
+                    'subplot_y_logs': y_logs,
+                    'subplot_show_legends': legends,
+                    'subplot_x_ranges': x_ranges,
+                    'subplot_y_ranges': y_ranges,
+                    'subplot_selections': selections,
                     'margins': [
                         widgets['logfile_lmargin'].get(), widgets['logfile_rmargin'].get(),
                         widgets['logfile_bmargin'].get(), widgets['logfile_tmargin'].get()
@@ -1701,10 +2387,15 @@ class GnuplotApp:
                 }
             }
             
-            # Save Normal mode settings
-            for widget_key, var in widgets.items():
-                if isinstance(var, (tk.StringVar, tk.BooleanVar)):
-                    tab_data['settings'][widget_key] = var.get()
+            # Save Normal mode settings. The serializable keys are fixed
+            # once the widgets exist, so the isinstance sweep runs only
+            # when the dict grew (i.e. the lazy logfile build ran).
+            if tab_info.get('serializable_len') != len(widgets):
+                tab_info['serializable_keys'] = [k for k, var in widgets.items()
+                                                if isinstance(var, (tk.StringVar, tk.BooleanVar))]
+                tab_info['serializable_len'] = len(widgets)
+            for widget_key in tab_info['serializable_keys']:
+                tab_data['settings'][widget_key] = widgets[widget_key].get()
 
             for item_id in widgets['tree'].get_children():
                 item = widgets['tree'].item(item_id)
@@ -1718,8 +2409,8 @@ class GnuplotApp:
             session_data['tabs'].append(tab_data)
 
         try:
-            with open(filepath, 'w') as f:
-                json.dump(session_data, f, indent=4)
+            with open(filepath, 'wb') as f:
+                f.write(_json_dumps(session_data))
             messagebox.showinfo("Success", f"Session saved to:\n{filepath}")
             return True
         except Exception as e:
@@ -1734,15 +2425,24 @@ class GnuplotApp:
             return
 
         try:
-            with open(filepath, 'r') as f:
-                session_data = json.load(f)
+            with open(filepath, 'rb') as f:
+                session_data = _json_loads(f.read())
         except Exception as e:
             messagebox.showerror("Load Error", f"Failed to load or parse session file.\nError: {e}")
             return
             
-        for tab_id in self.notebook.tabs():
-            if self.notebook.tab(tab_id, "text") != '+':
-                self.notebook.forget(tab_id)
+        # Release per-tab resources, then destroy the frames in one batch.
+        # Destroying a frame removes it from the notebook directly, which
+        # avoids Tk re-indexing the remaining tabs on every forget.
+        for key in list(self.tabs):
+            self._stop_log_tail(key)
+            self._enqueue_plot_job(key, None)
+            self._shutdown_gnuplot(key)
+        to_destroy = [tab_id for tab_id in self.notebook.tabs()
+                      if self.notebook.tab(tab_id, "text") != '+']
+        for tab_id in to_destroy:
+            self.root.nametowidget(tab_id).destroy()
+        self._return_actions.clear()
         self.tabs.clear()
         self.tab_counter = 0
 
@@ -1750,6 +2450,9 @@ class GnuplotApp:
              self.add_new_tab()
              return
 
+        pending_plots = []
+        pending_sashes = []
+        pending_parses = []
         for i, tab_data in enumerate(session_data['tabs']):
             new_key = self.add_new_tab()
             tab_info = self.tabs[new_key]
@@ -1757,8 +2460,14 @@ class GnuplotApp:
             
             self.notebook.tab(i, text=tab_data.get('tab_title', f"Plot {i+1}"))
             
-            # Restore Normal mode settings
+            # Restore Normal mode settings. Saved settings include vars
+            # from the lazily built logfile controls (e.g. the replot
+            # interval), so those widgets must exist before the generic
+            # sweep runs or their values are silently dropped.
             settings = tab_data.get('settings', {})
+            logfile_settings = tab_data.get('logfile_settings', {})
+            if logfile_settings or any(k.startswith('logfile_') for k in settings):
+                self._ensure_logfile_widgets(widgets, new_key)
             for key, value in settings.items():
                 if key in widgets and isinstance(widgets[key], (tk.StringVar, tk.BooleanVar)):
                     widgets[key].set(value)
@@ -1770,7 +2479,6 @@ class GnuplotApp:
                 widgets['tree'].insert('', 'end', values=ds.get('values', []), tags=tags, text=text)
 
             # Restore Logfile mode settings
-            logfile_settings = tab_data.get('logfile_settings', {})
             if logfile_settings:
                 widgets['logfile_path'].set(logfile_settings.get('path', ''))
                 tab_info['monitored_columns'] = logfile_settings.get('monitored_columns')
@@ -1781,33 +2489,26 @@ class GnuplotApp:
                 subplot_x_ranges = logfile_settings.get('subplot_x_ranges', [])
                 subplot_y_ranges = logfile_settings.get('subplot_y_ranges', [])
 
-                for j in range(4):
-                    # Restore labels and checkboxes
-                    if j < len(subplot_y_labels): widgets['subplot_vars'][j]['y_label'].set(subplot_y_labels[j])
-                    if j < len(subplot_y_logs): widgets['subplot_vars'][j]['y_log'].set(subplot_y_logs[j])
-                    if j < len(subplot_show_legends): widgets['subplot_vars'][j]['show_legend'].set(subplot_show_legends[j])
-                    
-                    # Restore X-axis range settings and UI state
-                    if j < len(subplot_x_ranges):
-                        x_range_data = subplot_x_ranges[j]
-                        x_range_vars = widgets['subplot_vars'][j]['x_range']
-                        x_range_vars['mode'].set(x_range_data.get('mode', 'auto'))
-                        x_range_vars['min'].set(x_range_data.get('min', ''))
-                        x_range_vars['max'].set(x_range_data.get('max', ''))
-                        state = 'normal' if x_range_vars['mode'].get() == 'manual' else 'disabled'
-                        x_range_vars['min_entry'].config(state=state)
-                        x_range_vars['max_entry'].config(state=state)
-
-                    # Restore Y-axis range settings and UI state
-                    if j < len(subplot_y_ranges):
-                        y_range_data = subplot_y_ranges[j]
-                        y_range_vars = widgets['subplot_vars'][j]['y_range']
-                        y_range_vars['mode'].set(y_range_data.get('mode', 'auto'))
-                        y_range_vars['min'].set(y_range_data.get('min', ''))
-                        y_range_vars['max'].set(y_range_data.get('max', ''))
-                        state = 'normal' if y_range_vars['mode'].get() == 'manual' else 'disabled'
-                        y_range_vars['min_entry'].config(state=state)
-                        y_range_vars['max_entry'].config(state=state)
+                # Restore labels and checkboxes
+                for var_key, values in (('y_label', subplot_y_labels),
+                                        ('y_log', subplot_y_logs),
+                                        ('show_legend', subplot_show_legends)):
+                    for j in range(min(4, len(values))):
+                        widgets['subplot_vars'][j][var_key].set(values[j])
+
+                # Restore axis range settings and UI state; X and Y share
+                # the same var layout, so one table drives both.
+                for axis_key, ranges in (('x_range', subplot_x_ranges),
+                                         ('y_range', subplot_y_ranges)):
+                    for j in range(min(4, len(ranges))):
+                        range_data = ranges[j]
+                        range_vars = widgets['subplot_vars'][j][axis_key]
+                        range_vars['mode'].set(range_data.get('mode', 'auto'))
+                        range_vars['min'].set(range_data.get('min', ''))
+                        range_vars['max'].set(range_data.get('max', ''))
+                        state = 'normal' if range_vars['mode'].get() == 'manual' else 'disabled'
+                        range_vars['min_entry'].config(state=state)
+                        range_vars['max_entry'].config(state=state)
 
 
                 margins = logfile_settings.get('margins', ['0.1', '0.9', '0.1', '0.9'])
@@ -1821,12 +2522,8 @@ class GnuplotApp:
                 widgets['logfile_grid_style'].set(logfile_settings.get('grid_style', 'Medium'))
                 
                 if widgets['logfile_path'].get():
-                    if self._execute_full_parse(widgets, new_key, widgets['logfile_path'].get(), silent=True):
-                        subplot_selections = logfile_settings.get('subplot_selections', [])
-                        for j, sel in enumerate(subplot_selections):
-                            if j < 4:
-                                for index in sel:
-                                    widgets['subplot_vars'][j]['listbox'].selection_set(index)
+                    pending_parses.append((widgets, new_key, widgets['logfile_path'].get(),
+                                           logfile_settings.get('subplot_selections', [])))
 
             mode = tab_data.get('mode', "Normal")
             widgets['mode'].set(mode)
@@ -1836,22 +2533,47 @@ class GnuplotApp:
             self.update_range_entry_state(widgets)
             self.update_margin_entry_state(widgets)
             self.update_aspect_ratio_entry_state(widgets)
-            self.plot(widgets, new_key)
-            
-            self.root.update_idletasks()
-            sash_pos = tab_data.get('sash_position')
+            pending_plots.append((widgets, new_key))
+            pending_sashes.append((tab_info, tab_data.get('sash_position'), tab_data.get('plot_sash_position')))
+
+        # Parse the restored logfiles in parallel: each parse reads an
+        # independent file, so the wall-clock cost drops from the sum of
+        # the parse times to roughly the largest one. Only the reads run
+        # off-thread; the results feed _finish_full_parse here on the Tk
+        # thread because it populates listboxes and tab state.
+        if pending_parses:
+            with ThreadPoolExecutor(max_workers=min(8, len(pending_parses))) as pool:
+                futures = [pool.submit(LogfileParser(path).parse)
+                           for _, _, path, _ in pending_parses]
+            for (widgets, new_key, _, selections), future in zip(pending_parses, futures):
+                df, error, byte_offset = future.result()
+                if self._finish_full_parse(widgets, new_key, df, error, byte_offset, True):
+                    for j, sel in enumerate(selections):
+                        if j < 4:
+                            for index in sel:
+                                widgets['subplot_vars'][j]['listbox'].selection_set(index)
+
+        # One geometry flush for all tabs, then place the sashes; flushing
+        # inside the loop forced a full layout pass per restored tab.
+        self.root.update_idletasks()
+        for tab_info, sash_pos, plot_sash_pos in pending_sashes:
             if sash_pos:
                 tab_info['paned_window'].sashpos(0, sash_pos)
-            
-            plot_sash_pos = tab_data.get('plot_sash_position')
             if plot_sash_pos:
-                # Only set sashpos if there are multiple panes (i.e., the sash exists)
-                if len(tab_info['plot_display_panedwindow'].panes()) > 1:
+                # The sash only exists once the log viewer pane is attached
+                if tab_info['log_viewer_attached']:
                     tab_info['plot_display_panedwindow'].sashpos(0, plot_sash_pos)
 
-
         self.notebook.select(0)
 
+        # Render the visible tab right away; the rest follow once the UI
+        # is idle instead of serializing all tabs before the window shows.
+        if pending_plots:
+            first_widgets, first_key = pending_plots[0]
+            self.plot(first_widgets, first_key)
+            for w, k in pending_plots[1:]:
+                self.root.after_idle(lambda w=w, k=k: k in self.tabs and self.plot(w, k))
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = GnuplotApp(root)